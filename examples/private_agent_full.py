@@ -16,10 +16,18 @@ Environment Variables (configured in .env):
 """
 
 import asyncio
+import ast
+import math
+import operator
 import os
+import re
 import sys
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -29,17 +37,161 @@ from unibase_agent_sdk.a2a import AgentMessage
 from a2a.types import AgentSkill
 
 
+# ============================================================================
+# Configuration
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class AgentEnv:
+    """Agent configuration read once from environment variables"""
+
+    aip_endpoint: str
+    gateway_url: str
+    host: str
+    port: int
+
+    @classmethod
+    def from_env(cls) -> "AgentEnv":
+        """Build configuration from the current environment"""
+        port = int(os.environ.get("AGENT_PORT", "8201"))
+        return cls(
+            aip_endpoint=os.environ.get("AIP_ENDPOINT", "http://api.aip.unibase.com"),
+            gateway_url=os.environ.get("GATEWAY_URL", "http://gateway.aip.unibase.com"),
+            host=os.environ.get("AGENT_HOST", "0.0.0.0"),
+            port=port,
+        )
+
+
 # ============================================================================
 # Agent Business Logic
 # ============================================================================
 
+# Allowed functions
+_SAFE_DICT = {
+    "sqrt": math.sqrt,
+    "pow": pow,
+    "abs": abs,
+    "round": round,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "log": math.log,
+    "exp": math.exp,
+    "pi": math.pi,
+    "e": math.e,
+}
+
+# Allowed operators
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Largest exponent accepted for ** and pow(), and the largest integer (in
+# bits) any step may produce, so "9 ** 9 ** 9" or "(10 ** 4000) ** 4000"
+# can't stall the worker
+_MAX_EXPONENT = 10000
+_MAX_RESULT_BITS = 1 << 16
+
+# Leading whitespace and prefix text (e.g., "calculate", "compute", "what is", etc.)
+# removed in one pass
+_CLEAN_RE = re.compile(
+    r"^\s*(?:(?:calculate|compute|what\s+is|what's|solve|evaluate|find|tell\s+me)\s*)*"
+)
+
+
+def _check_pow(base, exponent) -> None:
+    """Reject powers whose result would be too large to compute quickly"""
+    if abs(exponent) > _MAX_EXPONENT:
+        raise ValueError("Exponent too large")
+    if (
+        isinstance(base, int)
+        and isinstance(exponent, int)
+        and exponent > 0
+        and abs(base).bit_length() * exponent > _MAX_RESULT_BITS
+    ):
+        raise ValueError("Result too large")
+
+
+def _check_size(value):
+    """Reject integer intermediates beyond _MAX_RESULT_BITS"""
+    if isinstance(value, int) and value.bit_length() > _MAX_RESULT_BITS:
+        raise ValueError("Result too large")
+    return value
+
+
+def _eval_node(node: ast.AST):
+    """Evaluate a parsed expression node, allowing only numbers, _SAFE_DICT names and math operators"""
+    if isinstance(node, ast.Expression):
+        return _eval_node(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in _SAFE_DICT:
+        return _SAFE_DICT[node.id]
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        if isinstance(node.op, ast.Pow):
+            _check_pow(left, right)
+        return _check_size(_BIN_OPS[type(node.op)](left, right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _SAFE_DICT
+        and not node.keywords
+    ):
+        func = _SAFE_DICT[node.func.id]
+        args = [_eval_node(arg) for arg in node.args]
+        if func is pow and len(args) == 2:
+            _check_pow(*args)
+        return _check_size(func(*args))
+    raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+
+
+@lru_cache(maxsize=4096)
+def _calc_cached(expression: str) -> float:
+    """Clean and evaluate an expression (pure, so results are cached per raw input)"""
+    # Clean expression and remove possible prefix text. Lowercasing is kept
+    # so e.g. "SQRT(4)" still resolves against the lowercase function table
+    expression = _CLEAN_RE.sub("", expression.lower(), count=1).rstrip()
+
+    try:
+        # Walk the parsed expression instead of eval() so only arithmetic
+        # and the allowed functions can run
+        result = _eval_node(ast.parse(expression, mode="eval"))
+        return float(result)
+    except Exception as e:
+        raise ValueError(f"Invalid expression: {expression}") from e
+
+
 class CalculatorAgent:
     """Calculator Agent - Performs mathematical calculations (runs in private environment)"""
 
     def __init__(self):
         self.name = "Calculator Agent"
         self.memory = {}  # Simple conversation memory
-        self.calculation_history = []  # Calculation history
+        # Calculation history (bounded so a long-running agent doesn't grow forever)
+        self.calculation_history = deque(maxlen=int(os.environ.get("CALC_HISTORY_MAX", "1024")))
+
+        # Cap concurrent requests so a burst of tasks from Gateway can't
+        # oversubscribe the CPU or exhaust downstream connections
+        self._sem = asyncio.Semaphore(int(os.environ.get("AGENT_MAX_CONCURRENCY", "32")))
+
+        # History records are queued by the handler and written in batches by
+        # a background task, keeping record formatting off the request path
+        self._history_q = asyncio.Queue(maxsize=10000)
+        self._history_task = None
 
     async def handle(self, message_text: str) -> str:
         """
@@ -51,6 +203,54 @@ class CalculatorAgent:
         Returns:
             Calculation result string
         """
+        if self._history_task is None:
+            self._history_task = asyncio.create_task(self._drain_history())
+
+        async with self._sem:
+            return await self._handle(message_text)
+
+    async def _drain_history(self, batch_size: int = 100, flush_interval: float = 1.0):
+        """Move queued history records into calculation_history in batches until close()"""
+        batch = []
+        stopping = False
+        while not stopping:
+            try:
+                item = await asyncio.wait_for(self._history_q.get(), timeout=flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                if item is None:
+                    # Sentinel queued by close(), after every pending record
+                    stopping = True
+                else:
+                    batch.append(item)
+                    if len(batch) < batch_size:
+                        continue
+
+            if batch:
+                self._record_history(batch)
+                batch.clear()
+
+    def _record_history(self, batch) -> None:
+        """Append (timestamp, expression, result) records to calculation_history"""
+        self.calculation_history.extend(
+            {
+                "timestamp": datetime.fromtimestamp(ts).isoformat(),
+                "expression": expression,
+                "result": result,
+            }
+            for ts, expression, result in batch
+        )
+
+    async def close(self) -> None:
+        """Stop the history writer, flushing any buffered records"""
+        task, self._history_task = self._history_task, None
+        if task is not None:
+            await self._history_q.put(None)
+            await task
+
+    async def _handle(self, message_text: str) -> str:
+        """Handle a single calculation request (called under the concurrency cap)"""
         # For A2A mode, we receive simple text input
         intent = message_text
 
@@ -65,15 +265,17 @@ class CalculatorAgent:
 
         # Parse and execute calculation
         try:
-            result = self._calculate(intent)
-
-            # Record calculation history
-            calculation_record = {
-                "timestamp": datetime.now().isoformat(),
-                "expression": intent,
-                "result": result,
-            }
-            self.calculation_history.append(calculation_record)
+            # Run the CPU-bound math off the event loop so Gateway polling
+            # keeps going while the expression is evaluated
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, self._calculate, intent)
+
+            # Record calculation history (drop the record if the queue is full
+            # rather than blocking the response)
+            try:
+                self._history_q.put_nowait((time.time(), intent, result))
+            except asyncio.QueueFull:
+                pass
 
             # Format response
             response = self._format_response(intent, result, conversation_id)
@@ -95,42 +297,7 @@ class CalculatorAgent:
         Returns:
             Calculation result
         """
-        import math
-        import re
-
-        # Clean expression
-        expression = expression.lower().strip()
-
-        # Remove possible prefix text (e.g., "calculate", "compute", "what is", etc.)
-        prefixes = [
-            "calculate", "compute", "what is", "what's",
-            "solve", "evaluate", "find", "tell me",
-        ]
-        for prefix in prefixes:
-            if expression.startswith(prefix):
-                expression = expression[len(prefix):].strip()
-
-        # Allowed functions
-        safe_dict = {
-            "sqrt": math.sqrt,
-            "pow": pow,
-            "abs": abs,
-            "round": round,
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "log": math.log,
-            "exp": math.exp,
-            "pi": math.pi,
-            "e": math.e,
-        }
-
-        try:
-            # Use eval for calculation (restricted environment)
-            result = eval(expression, {"__builtins__": {}}, safe_dict)
-            return float(result)
-        except Exception as e:
-            raise ValueError(f"Invalid expression: {expression}")
+        return _calc_cached(expression)
 
     def _format_response(self, expression: str, result: float, conversation_id: str = None) -> str:
         """Format calculation response"""
@@ -153,10 +320,93 @@ class CalculatorAgent:
         return response
 
 
+# ============================================================================
+# Skills and Pricing (shared by registration and the A2A service)
+# ============================================================================
+
+# Single source for skill metadata: (id, name, description, tags, examples)
+_CALC_SKILL_SPECS = (
+    (
+        "calculator.compute",
+        "Mathematical Computation",
+        "Perform mathematical calculations including basic arithmetic, trigonometry, and algebraic operations",
+        ("math", "calculator", "computation", "arithmetic"),
+        (
+            "Calculate 25 * 4 + 10",
+            "What is sqrt(144)?",
+            "Compute 2 ** 8",
+            "Find sin(45)",
+        ),
+    ),
+)
+
+# Cost model (payment configuration) - $0.0005 per call (cheaper than public agent)
+_COST_MODEL = CostModel(
+    base_call_fee=0.0005,
+    per_token_fee=0.000005,
+)
+
+
+@lru_cache(maxsize=1)
+def _calc_skills() -> tuple[List[SkillConfig], List[AgentSkill]]:
+    """Build the AIP and A2A skill lists from _CALC_SKILL_SPECS (built once)"""
+    skill_configs = []
+    agent_skills = []
+    for skill_id, name, description, tags, examples in _CALC_SKILL_SPECS:
+        skill_configs.append(SkillConfig(
+            id=skill_id, name=name, description=description,
+            tags=list(tags), examples=list(examples),
+        ))
+        agent_skills.append(AgentSkill(
+            id=skill_id, name=name, description=description,
+            tags=list(tags), examples=list(examples),
+        ))
+    return skill_configs, agent_skills
+
+
 # ============================================================================
 # Agent Registration and Startup
 # ============================================================================
 
+# Shared AIP clients by endpoint, created on first use and reused by every startup call
+_AIP_CLIENTS: dict[str, AsyncAIPClient] = {}
+
+
+def _aip(aip_endpoint: str) -> AsyncAIPClient:
+    """Return the shared AsyncAIPClient for an endpoint, creating it on first call"""
+    client = _AIP_CLIENTS.get(aip_endpoint)
+    if client is None:
+        client = _AIP_CLIENTS[aip_endpoint] = AsyncAIPClient(base_url=aip_endpoint)
+    return client
+
+
+async def _close_aip() -> None:
+    """Close the shared AsyncAIPClients (safe to call if none were created)"""
+    while _AIP_CLIENTS:
+        _, client = _AIP_CLIENTS.popitem()
+        _LAST_HEALTHY.pop(client, None)
+        await client.close()
+
+
+# Monotonic time of the last successful AIP health check, per client
+_LAST_HEALTHY: dict[AsyncAIPClient, float] = {}
+
+
+async def _health_check_cached(client: AsyncAIPClient, ttl: float = 60.0) -> bool:
+    """Return the AIP health check result, reusing a healthy result for ttl seconds"""
+    now = time.monotonic()
+    last = _LAST_HEALTHY.get(client)
+    if last is not None and now - last < ttl:
+        return True
+    ok = await client.health_check()
+    # Only cache success so a retry loop notices as soon as the platform recovers
+    if ok:
+        _LAST_HEALTHY[client] = now
+    else:
+        _LAST_HEALTHY.pop(client, None)
+    return ok
+
+
 async def register_agent_to_platform(user_wallet: str) -> str:
     """
     Register agent with AIP platform (including on-chain registration)
@@ -172,91 +422,74 @@ async def register_agent_to_platform(user_wallet: str) -> str:
     print("="*70)
 
     # Get AIP endpoint
-    aip_endpoint = os.environ.get("AIP_ENDPOINT", "http://api.aip.unibase.com")
-    print(f"AIP Endpoint: {aip_endpoint}")
-
-    async with AsyncAIPClient(base_url=aip_endpoint) as client:
-        # 1. Check platform health
-        print("\n[1/4] Checking platform health...")
-        is_healthy = await client.health_check()
-        if not is_healthy:
-            raise RuntimeError("AIP platform is not available! Please check if the service is running.")
-        print("  ✓ Platform is healthy")
-
-        # 2. Prepare user information
-        print("\n[2/4] Preparing user information...")
-        user_id = f"user:{user_wallet}"
-        print(f"  User ID: {user_id}")
-
-        # 3. Define agent configuration
-        print("\n[3/4] Configuring agent information...")
-
-        # Define skills
-        skills = [
-            SkillConfig(
-                id="calculator.compute",
-                name="Mathematical Computation",
-                description="Perform mathematical calculations including basic arithmetic, trigonometry, and algebraic operations",
-                tags=["math", "calculator", "computation", "arithmetic"],
-                examples=[
-                    "Calculate 25 * 4 + 10",
-                    "What is sqrt(144)?",
-                    "Compute 2 ** 8",
-                    "Find sin(45)",
-                ],
-            ),
-        ]
-
-        # Define cost model (payment configuration)
-        cost_model = CostModel(
-            base_call_fee=0.0005,  # $0.0005 per call (cheaper than public agent)
-            per_token_fee=0.000005,
-        )
+    env = AgentEnv.from_env()
+    print(f"AIP Endpoint: {env.aip_endpoint}")
 
-        # Create agent configuration WITHOUT endpoint_url for polling mode
-        # Private agents behind firewall should NOT provide endpoint_url
-        # This triggers Gateway POLLING mode instead of PUSH mode
-
-        agent_config = AgentConfig(
-            name="Private Calculator Agent",
-            description="A private calculator agent running in a secure environment. Performs mathematical computations with conversation memory. Supports payment via X402 and memory via Membase.",
-            handle="calculator_private",  # Unique identifier
-            capabilities=["streaming", "batch", "memory"],
-            skills=skills,
-            cost_model=cost_model,
-            endpoint_url=None,  # NO endpoint for polling mode (private environment)
-            metadata={
-                "version": "1.0.0",
-                "author": "Unibase Demo",
-                "category": "utility",
-                "mode": "private",
-                "deployment": "gateway_polling",  # Private environment uses polling mode
-            },
-        )
+    client = _aip(env.aip_endpoint)
 
-        print(f"  Agent Name: {agent_config.name}")
-        print(f"  Handle: {agent_config.handle}")
-        print(f"  Skills: {len(skills)}")
-        print(f"  Base Call Fee: ${cost_model.base_call_fee} {agent_config.currency}")
-        print(f"  Deployment Mode: Gateway Polling (private environment)")
+    # 1. Check platform health
+    print("\n[1/4] Checking platform health...")
+    is_healthy = await _health_check_cached(client)
+    if not is_healthy:
+        raise RuntimeError("AIP platform is not available! Please check if the service is running.")
+    print("  ✓ Platform is healthy")
 
-        # 4. Register agent (including on-chain registration)
-        print("\n[4/4] Registering agent with platform (on-chain registration)...")
-        try:
-            result = await client.register_agent(user_id, agent_config)
-            agent_id = result.get("agent_id")
-            print(f"  ✓ Agent registered successfully!")
-            print(f"  Agent ID: {agent_id}")
-            print(f"  Handle: {agent_config.handle}")
+    # 2. Prepare user information
+    print("\n[2/4] Preparing user information...")
+    user_id = f"user:{user_wallet}"
+    print(f"  User ID: {user_id}")
 
-            return agent_id
+    # 3. Define agent configuration
+    print("\n[3/4] Configuring agent information...")
 
-        except Exception as e:
-            print(f"  ✗ Registration failed: {e}")
-            raise
+    # Skills and cost model are shared with start_agent_service
+    skills, _ = _calc_skills()
+    cost_model = _COST_MODEL
+
+    # Create agent configuration WITHOUT endpoint_url for polling mode
+    # Private agents behind firewall should NOT provide endpoint_url
+    # This triggers Gateway POLLING mode instead of PUSH mode
+
+    agent_config = AgentConfig(
+        name="Private Calculator Agent",
+        description="A private calculator agent running in a secure environment. Performs mathematical computations with conversation memory. Supports payment via X402 and memory via Membase.",
+        handle="calculator_private",  # Unique identifier
+        capabilities=["streaming", "batch", "memory"],
+        skills=skills,
+        cost_model=cost_model,
+        endpoint_url=None,  # NO endpoint for polling mode (private environment)
+        metadata={
+            "version": "1.0.0",
+            "author": "Unibase Demo",
+            "category": "utility",
+            "mode": "private",
+            "deployment": "gateway_polling",  # Private environment uses polling mode
+        },
+    )
+
+    print(f"  Agent Name: {agent_config.name}")
+    print(f"  Handle: {agent_config.handle}")
+    print(f"  Skills: {len(skills)}")
+    print(f"  Base Call Fee: ${cost_model.base_call_fee} {agent_config.currency}")
+    print(f"  Deployment Mode: Gateway Polling (private environment)")
+
+    # 4. Register agent (including on-chain registration)
+    print("\n[4/4] Registering agent with platform (on-chain registration)...")
+    try:
+        result = await client.register_agent(user_id, agent_config)
+        agent_id = result.get("agent_id")
+        print(f"  ✓ Agent registered successfully!")
+        print(f"  Agent ID: {agent_id}")
+        print(f"  Handle: {agent_config.handle}")
+
+        return agent_id
+
+    except Exception as e:
+        print(f"  ✗ Registration failed: {e}")
+        raise
 
 
-def start_agent_service(user_wallet: str, agent_id: str):
+async def start_agent_service(user_wallet: str, agent_id: str):
     """
     Start Agent A2A service (private mode - Gateway polling)
 
@@ -272,45 +505,26 @@ def start_agent_service(user_wallet: str, agent_id: str):
     calculator_agent = CalculatorAgent()
 
     # Get configuration
-    aip_endpoint = os.environ.get("AIP_ENDPOINT", "http://api.aip.unibase.com")
-    gateway_url = os.environ.get("GATEWAY_URL", "http://gateway.aip.unibase.com")
-    agent_host = os.environ.get("AGENT_HOST", "0.0.0.0")
-    agent_port = int(os.environ.get("AGENT_PORT", "8201"))
+    env = AgentEnv.from_env()
 
     # For private agents behind firewall, NO endpoint_url
     # The agent will poll Gateway for tasks instead of being called directly
     endpoint_url = None  # No endpoint for polling mode
 
     print(f"\nConfiguration:")
-    print(f"  AIP Endpoint: {aip_endpoint}")
-    print(f"  Gateway URL: {gateway_url}")
-    print(f"  Agent Host: {agent_host} (internal network only)")
-    print(f"  Agent Port: {agent_port} (internal port only)")
+    print(f"  AIP Endpoint: {env.aip_endpoint}")
+    print(f"  Gateway URL: {env.gateway_url}")
+    print(f"  Agent Host: {env.host} (internal network only)")
+    print(f"  Agent Port: {env.port} (internal port only)")
     print(f"  Endpoint URL: None (Polling Mode - agent polls Gateway for tasks)")
     print(f"  Mode: Gateway Polling (private environment behind firewall)")
 
-    # Define skills (consistent with registration)
-    skills = [
-        AgentSkill(
-            id="calculator.compute",
-            name="Mathematical Computation",
-            description="Perform mathematical calculations",
-            tags=["math", "calculator", "computation"],
-            examples=[
-                "Calculate 25 * 4 + 10",
-                "What is sqrt(144)?",
-            ],
-        ),
-    ]
-
-    # Define cost model (consistent with registration)
-    cost_model = CostModel(
-        base_call_fee=0.0005,
-        per_token_fee=0.000005,
-    )
+    # Skills and cost model (shared with registration)
+    _, skills = _calc_skills()
+    cost_model = _COST_MODEL
 
     print(f"\nStarting service...")
-    print(f"  Agent will poll Gateway at: {gateway_url}")
+    print(f"  Agent will poll Gateway at: {env.gateway_url}")
     print(f"  Agent Handle: calculator_private")
     print(f"  Mode: POLLING (agent actively polls for tasks)")
     print(f"  No public endpoint required (private environment)")
@@ -323,16 +537,16 @@ def start_agent_service(user_wallet: str, agent_id: str):
     server = expose_as_a2a(
         name="Private Calculator Agent",
         handler=calculator_agent.handle,
-        port=agent_port,
-        host=agent_host,
+        port=env.port,
+        host=env.host,
         description="A private calculator agent in secure environment",
         skills=skills,
         streaming=False,  # Calculator doesn't stream, returns complete result
 
         # Integration configuration
         user_id=f"user:{user_wallet}",
-        aip_endpoint=aip_endpoint,
-        gateway_url=gateway_url,
+        aip_endpoint=env.aip_endpoint,
+        gateway_url=env.gateway_url,
         handle="calculator_private",
         cost_model=cost_model,
         endpoint_url=None,  # NO endpoint URL - triggers polling mode
@@ -345,8 +559,11 @@ def start_agent_service(user_wallet: str, agent_id: str):
         # Agent will poll Gateway for tasks instead of waiting for incoming requests
     )
 
-    # Run service (synchronous mode)
-    server.run_sync()
+    # Run service on the caller's event loop (runs until stopped)
+    try:
+        await server.run()
+    finally:
+        await calculator_agent.close()
 
 
 # ============================================================================
@@ -373,15 +590,30 @@ def main():
     print(f"\nUsing account: {user_wallet}")
 
     try:
-        # Step 1: Register agent with platform (async)
-        async def do_registration():
-            return await register_agent_to_platform(user_wallet)
-
-        agent_id = asyncio.run(do_registration())
-
-        # Step 2: Start agent service (sync)
-        # Note: This is a blocking call that will run until manually stopped
-        start_agent_service(user_wallet, agent_id)
+        # Registration and the service share one event loop
+        async def run():
+            try:
+                # Step 1: Register agent with platform
+                agent_id = await register_agent_to_platform(user_wallet)
+
+                # Step 2: Start agent service (runs until manually stopped)
+                await start_agent_service(user_wallet, agent_id)
+            finally:
+                await _close_aip()
+
+        # Use uvloop for the event loop when available (optional:
+        # pip install uvloop, also shipped with uvicorn[standard])
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(run())
+        else:
+            if hasattr(uvloop, "run"):
+                uvloop.run(run())
+            else:
+                # uvloop < 0.18 has no run(); install() isn't deprecated there
+                uvloop.install()
+                asyncio.run(run())
 
     except KeyboardInterrupt:
         print("\n\n" + "="*70)
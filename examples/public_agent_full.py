@@ -18,6 +18,7 @@ Environment Variables (configured in .env):
 import asyncio
 import os
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
@@ -28,6 +29,33 @@ from unibase_agent_sdk.a2a import AgentMessage
 from a2a.types import AgentSkill
 
 
+# ============================================================================
+# Configuration
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class AgentEnv:
+    """Agent configuration read once from environment variables"""
+
+    aip_endpoint: str
+    gateway_url: str
+    host: str
+    port: int
+    public_url: str
+
+    @classmethod
+    def from_env(cls) -> "AgentEnv":
+        """Build configuration from the current environment"""
+        port = int(os.environ.get("AGENT_PORT", "8200"))
+        return cls(
+            aip_endpoint=os.environ.get("AIP_ENDPOINT", "http://api.aip.unibase.com"),
+            gateway_url=os.environ.get("GATEWAY_URL", "http://gateway.aip.unibase.com"),
+            host=os.environ.get("AGENT_HOST", "0.0.0.0"),
+            port=port,
+            public_url=os.environ.get("AGENT_PUBLIC_URL", f"http://your-public-ip:{port}"),
+        )
+
+
 # ============================================================================
 # Agent Business Logic
 # ============================================================================
@@ -140,10 +168,10 @@ async def register_agent_to_platform(user_wallet: str) -> str:
     print("="*70)
 
     # Get AIP endpoint
-    aip_endpoint = os.environ.get("AIP_ENDPOINT", "http://api.aip.unibase.com")
-    print(f"AIP Endpoint: {aip_endpoint}")
+    env = AgentEnv.from_env()
+    print(f"AIP Endpoint: {env.aip_endpoint}")
 
-    async with AsyncAIPClient(base_url=aip_endpoint) as client:
+    async with AsyncAIPClient(base_url=env.aip_endpoint) as client:
         # 1. Check platform health
         print("\n[1/4] Checking platform health...")
         is_healthy = await client.health_check()
@@ -182,7 +210,7 @@ async def register_agent_to_platform(user_wallet: str) -> str:
 
         # Create agent configuration with endpoint_url
         # The endpoint must be accessible by Gateway for DIRECT routing mode
-        endpoint_url = os.environ.get("AGENT_PUBLIC_URL", f"http://your-public-ip:8200")
+        endpoint_url = env.public_url
 
         agent_config = AgentConfig(
             name="Public Weather Agent",
@@ -222,7 +250,7 @@ async def register_agent_to_platform(user_wallet: str) -> str:
             raise
 
 
-def start_agent_service(user_wallet: str, agent_id: str):
+async def start_agent_service(user_wallet: str, agent_id: str):
     """
     Start Agent A2A service
 
@@ -238,20 +266,17 @@ def start_agent_service(user_wallet: str, agent_id: str):
     weather_agent = WeatherAgent()
 
     # Get configuration
-    aip_endpoint = os.environ.get("AIP_ENDPOINT", "http://api.aip.unibase.com")
-    gateway_url = os.environ.get("GATEWAY_URL", "http://gateway.aip.unibase.com")
-    agent_host = os.environ.get("AGENT_HOST", "0.0.0.0")
-    agent_port = int(os.environ.get("AGENT_PORT", "8200"))
+    env = AgentEnv.from_env()
 
     # For public agents, we need to provide the Gateway-accessible URL
     # The Gateway will proxy requests to this URL
-    endpoint_url = os.environ.get("AGENT_PUBLIC_URL", f"http://your-public-ip:{agent_port}")
+    endpoint_url = env.public_url
 
     print(f"\nConfiguration:")
-    print(f"  AIP Endpoint: {aip_endpoint}")
-    print(f"  Gateway URL: {gateway_url}")
-    print(f"  Agent Host: {agent_host}")
-    print(f"  Agent Port: {agent_port}")
+    print(f"  AIP Endpoint: {env.aip_endpoint}")
+    print(f"  Gateway URL: {env.gateway_url}")
+    print(f"  Agent Host: {env.host}")
+    print(f"  Agent Port: {env.port}")
     print(f"  Public Endpoint URL: {endpoint_url}")
 
     # Define skills (consistent with registration)
@@ -275,8 +300,8 @@ def start_agent_service(user_wallet: str, agent_id: str):
     )
 
     print(f"\nStarting service...")
-    print(f"  Agent will run on http://{agent_host}:{agent_port}")
-    print(f"  Agent Card: http://{agent_host}:{agent_port}/.well-known/agent-card.json")
+    print(f"  Agent will run on http://{env.host}:{env.port}")
+    print(f"  Agent Card: http://{env.host}:{env.port}/.well-known/agent-card.json")
     print(f"  All calls will be routed via Gateway")
     print(f"\n{'='*70}")
     print("Agent is running! Waiting for requests...")
@@ -287,16 +312,16 @@ def start_agent_service(user_wallet: str, agent_id: str):
     server = expose_as_a2a(
         name="Public Weather Agent",
         handler=weather_agent.handle,
-        port=agent_port,
-        host=agent_host,
+        port=env.port,
+        host=env.host,
         description="A public weather agent providing real-time weather information",
         skills=skills,
         streaming=False,  # Weather agent returns complete result, not streaming
 
         # Integration configuration
         user_id=f"user:{user_wallet}",
-        aip_endpoint=aip_endpoint,
-        gateway_url=gateway_url,
+        aip_endpoint=env.aip_endpoint,
+        gateway_url=env.gateway_url,
         handle="weather_public",  # Match registration handle
         cost_model=cost_model,
         endpoint_url=endpoint_url,  # Provide Gateway-accessible URL
@@ -307,8 +332,8 @@ def start_agent_service(user_wallet: str, agent_id: str):
         # The endpoint_url parameter should handle registration
     )
 
-    # Run service (synchronous mode)
-    server.run_sync()
+    # Run service on the caller's event loop (runs until stopped)
+    await server.run()
 
 
 # ============================================================================
@@ -334,15 +359,27 @@ def main():
     print(f"\nUsing account: {user_wallet}")
 
     try:
-        # Step 1: Register agent with platform (async)
-        async def do_registration():
-            return await register_agent_to_platform(user_wallet)
+        # Registration and the service share one event loop
+        async def run():
+            # Step 1: Register agent with platform
+            agent_id = await register_agent_to_platform(user_wallet)
 
-        agent_id = asyncio.run(do_registration())
+            # Step 2: Start agent service (runs until manually stopped)
+            await start_agent_service(user_wallet, agent_id)
 
-        # Step 2: Start agent service (sync)
-        # Note: This is a blocking call that will run until manually stopped
-        start_agent_service(user_wallet, agent_id)
+        # Use uvloop for the event loop when available (optional:
+        # pip install uvloop, also shipped with uvicorn[standard])
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(run())
+        else:
+            if hasattr(uvloop, "run"):
+                uvloop.run(run())
+            else:
+                # uvloop < 0.18 has no run(); install() isn't deprecated there
+                uvloop.install()
+                asyncio.run(run())
 
     except KeyboardInterrupt:
         print("\n\n" + "="*70)
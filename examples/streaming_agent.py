@@ -3,12 +3,48 @@
 Streaming Agent Example
 Demonstrates how to use raw streaming response with user_id injection and ag_ui protocol.
 """
-from openai import AsyncOpenAI
+import json
+import os
 from typing import AsyncIterator
 
 from unibase_agent_sdk import expose_as_a2a
-from ag_ui.core import TextMessageContentEvent, EventType, UserMessage, TextInputContent
-from ag_ui.encoder import EventEncoder
+
+# openai and ag_ui are imported on first use so starting the agent doesn't pay
+# for them up front
+_client = None
+
+
+def _get_client():
+    """Return the shared AsyncOpenAI client, creating it on first call."""
+    global _client
+    if _client is None:
+        from openai import AsyncOpenAI
+        _client = AsyncOpenAI()
+    return _client
+
+
+# Set AG_UI_VALIDATE_EVENTS=1 to build every event through the ag_ui pydantic
+# models (useful in development to catch schema drift)
+VALIDATE_EVENTS = os.environ.get("AG_UI_VALIDATE_EVENTS") == "1"
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # orjson is optional
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_content_event(message_id: str, delta: str) -> str:
+    """Encode a TEXT_MESSAGE_CONTENT event as an SSE frame without pydantic.
+
+    Produces the same frame as EventEncoder().encode(TextMessageContentEvent(...)).
+    """
+    payload = {"type": "TEXT_MESSAGE_CONTENT", "messageId": message_id, "delta": delta}
+    return f"data: {_dumps(payload)}\n\n"
+
 
 async def openai_streaming_handler(input_text: str, user_id: str = "anonymous") -> AsyncIterator[str]:
     """Streaming OpenAI handler with user_id injection using ag_ui."""
@@ -16,20 +52,8 @@ async def openai_streaming_handler(input_text: str, user_id: str = "anonymous")
     print(f"[Handler] Received input: {input_text}")
     print(f"[Handler] User ID: {user_id}")
     
-    # In real usage: from openai import AsyncOpenAI
-    client = AsyncOpenAI()
+    client = _get_client()
     
-    # Create UserMessage using ag_ui
-    message = UserMessage(
-        id="msg_input",
-        content=[
-            TextInputContent(text=input_text),
-        ],
-        role="user"
-    )
-    # payload = message.model_dump(by_alias=True)
-    # print(f"[Handler] Usage: Payload for OpenAI: {payload}")
-
     # Generate message ID for the stream
     stream = await client.chat.completions.create(
         model="gpt-4o",
@@ -37,18 +61,33 @@ async def openai_streaming_handler(input_text: str, user_id: str = "anonymous")
         max_tokens=1024,
         stream=True,
     )
-    encoder = EventEncoder()
-    
+    encoder = None
+    if VALIDATE_EVENTS:
+        from ag_ui.core import TextMessageContentEvent, EventType
+        from ag_ui.encoder import EventEncoder
+        encoder = EventEncoder()
+
+    # The completion id is the same for every chunk of a stream, so read it once
+    msg_id = None
+
     async for chunk in stream:
-        if chunk.choices[0].delta.content:
-            # Use ag_ui TextMessageContentEvent
-            event = TextMessageContentEvent(
-                type=EventType.TEXT_MESSAGE_CONTENT,
-                message_id=chunk.id,
-                delta=chunk.choices[0].delta.content,
-            )
-            sse_data = encoder.encode(event)
-            yield sse_data
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        if msg_id is None:
+            msg_id = chunk.id
+
+        if encoder is None:
+            yield encode_content_event(msg_id, delta)
+            continue
+
+        # Use ag_ui TextMessageContentEvent
+        event = TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT,
+            message_id=msg_id,
+            delta=delta,
+        )
+        yield encoder.encode(event)
 
 def main():
     print("Starting Streaming Agent with ag_ui...")
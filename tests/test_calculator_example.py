@@ -0,0 +1,78 @@
+"""Tests for the expression evaluator in examples/private_agent_full.py."""
+
+import ast
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "private_agent_full.py"
+_spec = importlib.util.spec_from_file_location("private_agent_full", _EXAMPLE)
+calculator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(calculator)
+
+
+def evaluate(expression):
+    return calculator._eval_node(ast.parse(expression, mode="eval"))
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("1 + 2 * 3", 7),
+    ("-(4 - 10) // 4", 1),
+    ("sqrt(16) + abs(-2)", 6.0),
+    ("2 ** 10", 1024),
+    ("pow(2, 10)", 1024),
+    ("2 ** -2", 0.25),
+    ("pi", calculator.math.pi),
+])
+def test_evaluates_allowed_expressions(expression, expected):
+    assert evaluate(expression) == expected
+
+
+@pytest.mark.parametrize("expression", [
+    f"2 ** {calculator._MAX_EXPONENT + 1}",
+    f"pow(2, {calculator._MAX_EXPONENT + 1})",
+    "9 ** 9 ** 9",
+])
+def test_rejects_exponents_over_the_limit(expression):
+    with pytest.raises(ValueError, match="Exponent too large"):
+        evaluate(expression)
+
+
+@pytest.mark.parametrize("expression", [
+    "(10 ** 4000) ** 4000",
+    "pow(10 ** 4000, 4000)",
+    "10 ** 4000 * 10 ** 4000 * 10 ** 4000 * 10 ** 4000 * 10 ** 4000 * 10 ** 4000",
+])
+def test_rejects_results_over_the_size_limit(expression):
+    with pytest.raises(ValueError, match="Result too large"):
+        evaluate(expression)
+
+
+def test_accepts_results_within_the_size_limit():
+    # bit_length(255) * 8192 is exactly _MAX_RESULT_BITS
+    exponent = calculator._MAX_RESULT_BITS // 8
+    assert evaluate(f"255 ** {exponent}").bit_length() <= calculator._MAX_RESULT_BITS
+    with pytest.raises(ValueError, match="Result too large"):
+        evaluate(f"255 ** {exponent + 1}")
+
+
+@pytest.mark.parametrize("expression", [
+    "__import__('os')",
+    "open",
+    "(1).__class__",
+    "[1, 2]",
+    "'a' * 3",
+    "1 << 10",
+    "lambda: 1",
+    "sqrt(x=4)",
+])
+def test_rejects_disallowed_syntax(expression):
+    with pytest.raises(ValueError):
+        evaluate(expression)
+
+
+def test_calc_cached_chains_the_original_error():
+    with pytest.raises(ValueError, match="Invalid expression") as excinfo:
+        calculator._calc_cached("9 ** 9 ** 9")
+    assert isinstance(excinfo.value.__cause__, ValueError)
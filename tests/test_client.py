@@ -0,0 +1,245 @@
+"""Tests for the A2A client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from a2a.client.helpers import create_text_message_object
+
+from unibase_agent_sdk.a2a.agent_card import agent_card_from_metadata
+from unibase_agent_sdk.a2a.client import (
+    A2AClient,
+    TaskExecutionError,
+    _parse_agent_card,
+    _SSEDecoder,
+)
+
+
+async def test_owned_pool_is_closed_when_the_block_exits():
+    async with A2AClient() as client:
+        pool = client.http_client
+        assert not pool.is_closed
+    assert pool.is_closed
+
+
+async def test_nested_context_entries_share_the_owned_pool():
+    client = A2AClient()
+
+    async with client:
+        pool = client.http_client
+        async with client:
+            assert client.http_client is pool
+        assert not pool.is_closed
+    assert pool.is_closed
+
+
+def test_shared_pool_is_per_loop_and_closed_with_its_loop():
+    async def shared_pool():
+        return A2AClient().http_client
+
+    first = asyncio.run(shared_pool())
+    second = asyncio.run(shared_pool())
+
+    assert second is not first
+    assert first.is_closed
+    assert second.is_closed
+
+
+async def test_aclose_shared_closes_the_running_loops_pool():
+    pool = A2AClient().http_client
+    assert A2AClient().http_client is pool
+
+    await A2AClient.aclose_shared()
+    assert pool.is_closed
+    assert A2AClient().http_client is not pool
+    await A2AClient.aclose_shared()
+
+
+async def test_discover_agents_fetches_equivalent_urls_once():
+    card = agent_card_from_metadata({"name": "Echo"}, "http://agent.example")
+    fetched = []
+
+    def handler(request):
+        fetched.append(str(request.url))
+        return httpx.Response(200, content=card.model_dump_json(by_alias=True))
+
+    client = A2AClient()
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        cards = await client.discover_agents(["http://agent.example", "http://agent.example/"])
+    finally:
+        await client.aclose()
+
+    assert fetched == ["http://agent.example/.well-known/agent-card.json"]
+    assert set(cards) == {"http://agent.example", "http://agent.example/"}
+    assert cards["http://agent.example"].name == "Echo"
+
+
+async def test_parsed_agent_cards_are_not_shared_between_callers():
+    body = agent_card_from_metadata({"name": "Echo"}, "http://agent.example").model_dump_json(
+        by_alias=True
+    ).encode()
+
+    first = await _parse_agent_card(body)
+    first.name = "Changed"
+    first.capabilities.streaming = False
+    second = await _parse_agent_card(body)
+
+    assert second is not first
+    assert second.name == "Echo"
+    assert second.capabilities.streaming is True
+
+
+def _decode(*chunks):
+    decoder = _SSEDecoder()
+    events = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    return events, decoder
+
+
+def test_sse_decoder_handles_crlf_line_endings():
+    events, _ = _decode(b'data: {"a": 1}\r\n\r\ndata: {"b": 2}\r\n\r\n')
+    assert events == [b'{"a": 1}', b'{"b": 2}']
+
+
+def test_sse_decoder_joins_multi_line_data():
+    events, _ = _decode(b"data: first\ndata:second\n\n")
+    assert events == [b"first\nsecond"]
+
+
+def test_sse_decoder_skips_comments_and_other_fields():
+    events, _ = _decode(b": keep-alive\nevent: update\nid: 7\nretry: 100\ndata: x\n\n")
+    assert events == [b"x"]
+
+
+def test_sse_decoder_reassembles_frames_split_across_chunks():
+    events, _ = _decode(b"da", b'ta: {"a"', b": 1}\r", b"\n", b"\r\n")
+    assert events == [b'{"a": 1}']
+
+
+def test_sse_decoder_flushes_trailing_frame_without_blank_line():
+    events, decoder = _decode(b"data: done\n\ndata: last")
+    assert events == [b"done"]
+    assert decoder.flush() == [b"last"]
+    assert decoder.flush() == []
+
+
+def _mock_client(handler):
+    client = A2AClient()
+    client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _task(task_id):
+    return {"id": task_id, "contextId": "ctx", "kind": "task", "status": {"state": "completed"}}
+
+
+async def test_get_tasks_matches_reordered_batch_responses_by_id():
+    def handler(request):
+        batch = json.loads(request.content)
+        responses = [
+            {"jsonrpc": "2.0", "id": entry["id"], "result": _task(entry["params"]["id"])}
+            for entry in reversed(batch)
+        ]
+        return httpx.Response(200, json=responses)
+
+    client = _mock_client(handler)
+    try:
+        tasks = await client.get_tasks("http://agent.example", ["a", "b", "c"])
+    finally:
+        await client.aclose()
+
+    assert [task.id for task in tasks] == ["a", "b", "c"]
+
+
+async def test_get_tasks_raises_per_entry_errors():
+    def handler(request):
+        batch = json.loads(request.content)
+        return httpx.Response(200, json=[
+            {"jsonrpc": "2.0", "id": batch[0]["id"], "result": _task("a")},
+            {"jsonrpc": "2.0", "id": batch[1]["id"],
+             "error": {"code": -32001, "message": "Task not found: b"}},
+        ])
+
+    client = _mock_client(handler)
+    try:
+        with pytest.raises(TaskExecutionError, match="Task not found: b"):
+            await client.get_tasks("http://agent.example", ["a", "b"])
+    finally:
+        await client.aclose()
+
+
+async def test_get_tasks_rejects_batch_missing_a_response():
+    def handler(request):
+        batch = json.loads(request.content)
+        return httpx.Response(200, json=[
+            {"jsonrpc": "2.0", "id": batch[0]["id"], "result": _task("a")},
+        ])
+
+    client = _mock_client(handler)
+    try:
+        with pytest.raises(TaskExecutionError, match="missing batch entry"):
+            await client.get_tasks("http://agent.example", ["a", "b"])
+    finally:
+        await client.aclose()
+
+
+def _sse(data):
+    return b"data: " + json.dumps(data).encode() + b"\n\n"
+
+
+async def test_breaking_out_of_stream_task_cancels_the_producer():
+    body_closed = asyncio.Event()
+
+    async def endless_stream():
+        try:
+            while True:
+                yield _sse({"jsonrpc": "2.0", "id": 1, "result": {}})
+                await asyncio.sleep(0)
+        finally:
+            body_closed.set()
+
+    client = _mock_client(lambda request: httpx.Response(200, content=endless_stream()))
+    try:
+        events = client.stream_task("http://agent.example", create_text_message_object(content="hi"))
+        async for _ in events:
+            break
+        await events.aclose()
+
+        assert body_closed.is_set()
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+    finally:
+        await client.aclose()
+
+
+async def test_stream_task_raises_producer_errors_in_the_consumer():
+    async def failing_stream():
+        yield _sse({"jsonrpc": "2.0", "id": 1, "result": {}})
+        yield _sse({"jsonrpc": "2.0", "id": 1, "error": {"code": -32603, "message": "boom"}})
+
+    client = _mock_client(lambda request: httpx.Response(200, content=failing_stream()))
+    received = []
+    try:
+        with pytest.raises(TaskExecutionError, match="Stream error: boom"):
+            async for event in client.stream_task(
+                "http://agent.example", create_text_message_object(content="hi")
+            ):
+                received.append(event)
+    finally:
+        await client.aclose()
+
+    assert len(received) == 1
+
+
+async def test_stream_task_wraps_http_errors():
+    client = _mock_client(lambda request: httpx.Response(500))
+    try:
+        with pytest.raises(TaskExecutionError, match="Streaming error"):
+            async for _ in client.stream_task(
+                "http://agent.example", create_text_message_object(content="hi")
+            ):
+                pass
+    finally:
+        await client.aclose()
@@ -0,0 +1,130 @@
+"""Tests for the A2A server HTTP endpoints."""
+
+import asyncio
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from unibase_agent_sdk import expose_as_a2a
+from unibase_agent_sdk.a2a import server as server_module
+
+CARD_PATH = "/.well-known/agent-card.json"
+
+
+@pytest.fixture
+def server():
+    return expose_as_a2a(name="Echo", handler=lambda text: f"echo {text}", port=8123)
+
+
+@pytest.fixture
+def client(server):
+    return TestClient(server.create_app())
+
+
+def test_agent_card_revalidates_with_etag(client):
+    response = client.get(CARD_PATH)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(CARD_PATH, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_agent_card_is_served_from_cached_bytes(server, client, monkeypatch):
+    client.get(CARD_PATH)
+
+    def fail():
+        raise AssertionError("card re-serialized")
+
+    monkeypatch.setattr(server, "_serialize_agent_card", fail)
+    assert client.get(CARD_PATH).status_code == 200
+
+
+def test_agent_card_updates_when_inputs_are_reassigned(server, client):
+    etag = client.get(CARD_PATH).headers["etag"]
+
+    server.registration_config = {"endpoint_url": "http://agent.example"}
+    response = client.get(CARD_PATH, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["url"] == "http://agent.example"
+
+
+def test_agent_card_updates_after_in_place_change_and_invalidate(server, client):
+    etag = client.get(CARD_PATH).headers["etag"]
+
+    server.agent_card.description = "Changed in place"
+    server.invalidate_card()
+    response = client.get(CARD_PATH, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["description"] == "Changed in place"
+    assert response.headers["etag"] != etag
+
+
+def test_registration_config_is_copied_on_assignment(server):
+    config = {"endpoint_url": "http://agent.example"}
+    server.registration_config = config
+    config["endpoint_url"] = "http://elsewhere.example"
+    assert server.registration_config["endpoint_url"] == "http://agent.example"
+
+
+def _rpc(method, request_id=None, **params):
+    request = {"jsonrpc": "2.0", "method": method, "params": params}
+    if request_id is not None:
+        request["id"] = request_id
+    return request
+
+
+def test_batch_skips_notifications(client):
+    response = client.post("/", json=[_rpc("tasks/list", 1), _rpc("tasks/list")])
+    assert response.status_code == 200
+    assert [entry["id"] for entry in response.json()] == [1]
+
+
+def test_batch_of_notifications_returns_no_content(client):
+    response = client.post("/", json=[_rpc("tasks/list"), _rpc("tasks/list")])
+    assert response.status_code == 204
+    assert response.content == b""
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_reuse_parent_ids():
+    server_module._new_hex_id()  # make sure the parent's pool is filled
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write_fd, server_module._new_hex_id().encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+    child_id = os.read(read_fd, 64).decode()
+    os.close(read_fd)
+    os.close(write_fd)
+
+    assert child_id != server_module._new_hex_id()
+
+
+def test_oversized_batch_is_rejected(client):
+    batch = [_rpc("tasks/list", i) for i in range(server_module._MAX_BATCH_SIZE + 1)]
+    response = client.post("/", json=batch)
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == -32600
+
+
+def test_batch_fan_out_is_bounded(server, client, monkeypatch):
+    running = peak = 0
+
+    async def tasks_list(params):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"tasks": []}
+
+    monkeypatch.setitem(server._method_handlers, "tasks/list", tasks_list)
+    batch = [_rpc("tasks/list", i) for i in range(server_module._MAX_BATCH_SIZE)]
+    response = client.post("/", json=batch)
+
+    assert response.status_code == 200
+    assert len(response.json()) == server_module._MAX_BATCH_SIZE
+    assert peak <= server_module._BATCH_CONCURRENCY
@@ -4,29 +4,64 @@
 __version__ = "0.1.0"
 __author__ = "Unibase Team"
 
+import importlib
+from typing import TYPE_CHECKING
+
 # Core types
 from unibase_agent_sdk.core.types import (
     AgentType,
     AgentIdentity,
 )
 
-# Generic Wrappers (wrap ANY agent as A2A service)
-from unibase_agent_sdk.wrappers import (
-    expose_as_a2a,
-    wrap_agent,
-    AgentWrapper,
+# Everything else is imported on first attribute access (PEP 562), so
+# "import unibase_agent_sdk" doesn't load the A2A server, client, wrappers and
+# registry (and their fastapi/httpx/aip_sdk dependencies) until they're used
+_LAZY_IMPORTS = {
+    # Generic Wrappers (wrap ANY agent as A2A service)
+    "expose_as_a2a": ("unibase_agent_sdk.wrappers", "expose_as_a2a"),
+    "wrap_agent": ("unibase_agent_sdk.wrappers", "wrap_agent"),
+    "AgentWrapper": ("unibase_agent_sdk.wrappers", "AgentWrapper"),
     # Framework-specific wrappers
-    expose_langgraph_as_a2a,
-    LangGraphWrapper,
-    expose_adk_as_a2a,
-    ADKWrapper,
-)
+    "expose_langgraph_as_a2a": ("unibase_agent_sdk.wrappers", "expose_langgraph_as_a2a"),
+    "LangGraphWrapper": ("unibase_agent_sdk.wrappers", "LangGraphWrapper"),
+    "expose_adk_as_a2a": ("unibase_agent_sdk.wrappers", "expose_adk_as_a2a"),
+    "ADKWrapper": ("unibase_agent_sdk.wrappers", "ADKWrapper"),
+    # A2A Server and extensions
+    "A2AServer": ("unibase_agent_sdk.a2a", "A2AServer"),
+    "StreamResponse": ("unibase_agent_sdk.a2a", "StreamResponse"),
+    "A2AClient": ("unibase_agent_sdk.a2a", "A2AClient"),
+    # Registry (AIP platform integration)
+    "AgentRegistry": ("unibase_agent_sdk.registry", "AgentRegistryClient"),
+    "RegistrationMode": ("unibase_agent_sdk.registry", "RegistrationMode"),
+}
+
+if TYPE_CHECKING:
+    from unibase_agent_sdk.wrappers import (
+        expose_as_a2a,
+        wrap_agent,
+        AgentWrapper,
+        expose_langgraph_as_a2a,
+        LangGraphWrapper,
+        expose_adk_as_a2a,
+        ADKWrapper,
+    )
+    from unibase_agent_sdk.a2a import A2AServer, StreamResponse, A2AClient
+    from unibase_agent_sdk.registry import AgentRegistryClient as AgentRegistry, RegistrationMode
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
 
-# A2A Server and extensions
-from unibase_agent_sdk.a2a import A2AServer, StreamResponse, A2AClient
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# Registry (AIP platform integration)
-from unibase_agent_sdk.registry import AgentRegistryClient as AgentRegistry, RegistrationMode
 
 __all__ = [
     # Version
@@ -13,6 +13,9 @@ from a2a.types import (
 
 from ..core.types import AgentIdentity
 
+# Default input/output MIME types advertised by Unibase agent cards
+DEFAULT_IO_MODES = ("text/plain", "application/json")
+
 
 def generate_agent_card(
     identity: AgentIdentity,
@@ -26,12 +29,11 @@ def generate_agent_card(
     """Generate an A2A Agent Card from AgentIdentity."""
     # Normalize base URL (remove trailing slash)
     base_url = base_url.rstrip("/")
+    identity_metadata = identity.metadata
 
     # Default description from identity name
     if description is None:
-        description = f"AI agent: {identity.name}"
-        if identity.metadata.get("description"):
-            description = identity.metadata["description"]
+        description = identity_metadata.get("description") or f"AI agent: {identity.name}"
 
     # Default capabilities
     if capabilities is None:
@@ -43,25 +45,28 @@ def generate_agent_card(
 
     # Default skill from identity metadata if none provided
     if skills is None:
-        skills = []
         # Check if identity has skill metadata
-        if identity.metadata.get("skills"):
-            for skill_data in identity.metadata["skills"]:
-                skills.append(AgentSkill(
-                    id=skill_data.get("id", f"{identity.name.lower()}-skill"),
+        skill_metadata = identity_metadata.get("skills")
+        if skill_metadata:
+            default_id = f"{identity.name.lower()}-skill"
+            skills = [
+                AgentSkill(
+                    id=skill_data.get("id", default_id),
                     name=skill_data.get("name", identity.name),
                     description=skill_data.get("description", description),
                     tags=skill_data.get("tags", []),
                     examples=skill_data.get("examples"),
-                ))
+                )
+                for skill_data in skill_metadata
+            ]
         else:
             # Create a default skill
-            skills.append(AgentSkill(
+            skills = [AgentSkill(
                 id=f"{identity.agent_id}-default",
                 name=identity.name,
                 description=description,
                 tags=[identity.agent_type.value, "unibase"],
-            ))
+            )]
 
     # Build the agent card
     card = AgentCard(
@@ -72,8 +77,8 @@ def generate_agent_card(
         capabilities=capabilities,
         skills=skills,
         provider=provider,
-        default_input_modes=["text/plain", "application/json"],
-        default_output_modes=["text/plain", "application/json"],
+        default_input_modes=list(DEFAULT_IO_MODES),
+        default_output_modes=list(DEFAULT_IO_MODES),
     )
 
     return card
@@ -84,27 +89,30 @@ def agent_card_from_metadata(
     base_url: str
 ) -> AgentCard:
     """Generate an Agent Card from raw metadata dictionary."""
-    skills = []
-    for skill_data in metadata.get("skills", []):
-        skills.append(AgentSkill(
+    skills = [
+        AgentSkill(
             id=skill_data["id"],
             name=skill_data["name"],
             description=skill_data["description"],
             tags=skill_data.get("tags", []),
             examples=skill_data.get("examples"),
-        ))
+        )
+        for skill_data in metadata.get("skills", ())
+    ]
 
+    capability_data = metadata.get("capabilities", {})
     capabilities = AgentCapabilities(
-        streaming=metadata.get("capabilities", {}).get("streaming", True),
-        pushNotifications=metadata.get("capabilities", {}).get("push_notifications", False),
-        stateTransitionHistory=metadata.get("capabilities", {}).get("state_transition_history", True)
+        streaming=capability_data.get("streaming", True),
+        pushNotifications=capability_data.get("push_notifications", False),
+        stateTransitionHistory=capability_data.get("state_transition_history", True)
     )
 
     provider = None
-    if metadata.get("provider"):
+    provider_data = metadata.get("provider")
+    if provider_data:
         provider = AgentProvider(
-            organization=metadata["provider"]["organization"],
-            url=metadata["provider"].get("url")
+            organization=provider_data["organization"],
+            url=provider_data.get("url")
         )
 
     return AgentCard(
@@ -115,6 +123,6 @@ def agent_card_from_metadata(
         capabilities=capabilities,
         skills=skills,
         provider=provider,
-        default_input_modes=["text/plain", "application/json"],
-        default_output_modes=["text/plain", "application/json"],
+        default_input_modes=list(DEFAULT_IO_MODES),
+        default_output_modes=list(DEFAULT_IO_MODES),
     )
@@ -1,7 +1,13 @@
 """A2A Protocol Client."""
 
-from typing import Optional, Dict, Any, AsyncIterator, List
-import json
+from typing import Optional, Dict, Any, AsyncGenerator, AsyncIterator, List, Tuple
+from collections import OrderedDict
+import asyncio
+import hashlib
+import importlib.util
+import itertools
+import re
+import time
 import uuid
 
 import httpx
@@ -23,6 +29,10 @@ from a2a.client.errors import (
 
 # Import Unibase extensions
 from .types import StreamResponse
+from ..utils.serialization import dumps, loads, JSONDecodeError
+from ..utils.logger import get_logger
+
+logger = get_logger("a2a.client")
 
 
 class AgentDiscoveryError(A2AClientError):
@@ -38,45 +48,297 @@ class TaskExecutionError(A2AClientError):
         self.error = error
 
 
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _new_http_client(timeout: httpx.Timeout) -> httpx.AsyncClient:
+    """Create a pooled HTTP client (HTTP/2 when h2 is installed)."""
+    return httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=30.0,
+        ),
+        timeout=timeout,
+    )
+
+# Parsed agent cards keyed by a hash of the response body, so refetching an
+# unchanged card (e.g. force_refresh or another client instance) skips parsing.
+# Callers get a copy, never the cached instance, since AgentCard is mutable.
+_CARD_CACHE_SIZE = 1024
+_CARD_CACHE_TTL = 60.0
+_parsed_cards: "OrderedDict[bytes, Tuple[float, AgentCard]]" = OrderedDict()
+
+
+# Most distinct agent URLs A2AClient keeps resolved endpoints / cards for
+_URL_CACHE_SIZE = 1024
+_AGENT_CACHE_SIZE = 1024
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*\"?(\d+)")
+
+
+def _max_age(cache_control: Optional[str], default: float) -> float:
+    """Seconds a response may be reused for, from its Cache-Control header."""
+    if not cache_control:
+        return default
+    directives = cache_control.lower()
+    if "no-store" in directives or "no-cache" in directives:
+        return 0.0
+    match = _MAX_AGE_RE.search(directives)
+    return float(match.group(1)) if match else default
+
+# Bodies larger than this are decoded in a worker thread so a big agent card
+# or task history doesn't stall the event loop
+_OFFLOAD_THRESHOLD = 16 * 1024
+
+
+async def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, off the event loop when it is large."""
+    body = response.content
+    if len(body) > _OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(loads, body)
+    return loads(body)
+
+
+async def _parse_agent_card(body: bytes) -> AgentCard:
+    """Parse an agent card response body, reusing a recent parse of the same bytes."""
+    key = hashlib.blake2b(body, digest_size=16).digest()
+    now = time.monotonic()
+    entry = _parsed_cards.get(key)
+    if entry is not None and now - entry[0] < _CARD_CACHE_TTL:
+        _parsed_cards.move_to_end(key)
+        return entry[1].model_copy(deep=True)
+
+    if len(body) > _OFFLOAD_THRESHOLD:
+        card = await asyncio.to_thread(AgentCard.model_validate_json, body)
+    else:
+        card = AgentCard.model_validate_json(body)
+    _parsed_cards[key] = (now, card)
+    _parsed_cards.move_to_end(key)
+    if len(_parsed_cards) > _CARD_CACHE_SIZE:
+        _parsed_cards.popitem(last=False)
+    return card.model_copy(deep=True)
+
+
+class _SSEDecoder:
+    """Incremental Server-Sent Events parser working on raw response bytes.
+
+    feed() returns the data payload of each event completed by the chunk
+    (multi-line data joined with newlines, per the SSE spec), as bytes ready
+    for the JSON decoder. Only data lines are copied out of the buffer;
+    comments and event/id/retry fields are skipped without decoding.
+    """
+
+    __slots__ = ("_buf", "_data")
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._data: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        buf = self._buf
+        buf += chunk
+        events = []
+        start = 0
+        while True:
+            end = buf.find(b"\n", start)
+            if end < 0:
+                break
+            self._line(buf, start, end, events)
+            start = end + 1
+        if start:
+            del buf[:start]
+        return events
+
+    def flush(self) -> List[bytes]:
+        """Return any event left unterminated when the stream ended."""
+        events = []
+        if self._buf:
+            self._line(self._buf, 0, len(self._buf), events)
+            self._buf.clear()
+        if self._data:
+            events.append(b"\n".join(self._data))
+            self._data = []
+        return events
+
+    def _line(self, buf: bytearray, start: int, end: int, events: List[bytes]) -> None:
+        if end > start and buf[end - 1] == 0x0D:  # CRLF line ending
+            end -= 1
+        if end == start:
+            # Blank line dispatches the event
+            if self._data:
+                events.append(b"\n".join(self._data))
+                self._data = []
+        elif buf.startswith(b"data:", start, end):
+            value_start = start + 5
+            if value_start < end and buf[value_start] == 0x20:
+                value_start += 1
+            self._data.append(bytes(buf[value_start:end]))
+
+
+async def _close_at_loop_shutdown(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    """Suspend until finalized, then close client.
+
+    Loops finalize unfinished async generators during shutdown, which gives a
+    shared pool the chance to close while its loop can still run the close.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
 class A2AClient:
     """Client for communicating with A2A-compliant agents."""
 
+    # Connection pools shared by A2AClient instances that don't own a client
+    # (see http_client), one per event loop, each with the async generator
+    # that closes it when its loop shuts down
+    _shared_clients: Dict[
+        Optional[asyncio.AbstractEventLoop],
+        Tuple[httpx.AsyncClient, Optional[AsyncGenerator[None, None]]],
+    ] = {}
+
     def __init__(
         self,
         timeout: float = 30.0,
         headers: Optional[Dict[str, str]] = None,
+        agent_cache_ttl: float = 300.0,
     ):
-        """Initialize A2A client."""
+        """Initialize A2A client.
+
+        Discovered Agent Cards are reused for the max-age the agent sends in
+        Cache-Control, or agent_cache_ttl seconds if it sends none.
+        """
         self.timeout = timeout
+        self.agent_cache_ttl = agent_cache_ttl
+        self._request_timeout = httpx.Timeout(timeout, connect=min(timeout, 5.0))
         self._headers = headers or {}
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
+
+        # JSON-RPC ids only need to be unique per client: a random prefix
+        # plus a counter avoids a urandom read and UUID formatting per call
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_counter = itertools.count(1)
+
+        # agent_url -> (JSON-RPC url, stream url)
+        self._url_cache: Dict[str, Tuple[str, str]] = {}
         self._http_client: Optional[httpx.AsyncClient] = None
+        # Open ``async with`` blocks; the owned client closes when the last exits
+        self._context_depth = 0
 
-        # Cache for discovered agents
-        self._agent_cache: Dict[str, AgentCard] = {}
+        # Cache for discovered agents: base_url -> (card, expires_at)
+        self._agent_cache: "OrderedDict[str, Tuple[AgentCard, float]]" = OrderedDict()
 
     async def __aenter__(self) -> "A2AClient":
-        """Async context manager entry."""
-        self._http_client = httpx.AsyncClient(timeout=self.timeout)
+        """Async context manager entry.
+
+        Nested ``async with`` blocks on the same client share its HTTP client.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = _new_http_client(self._request_timeout)
+        self._context_depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self._http_client:
-            await self._http_client.aclose()
+        """Async context manager exit (closes the owned HTTP client on the last exit)."""
+        self._context_depth -= 1
+        if self._context_depth == 0:
+            await self.close()
+
+    @classmethod
+    def _get_shared_client(cls) -> httpx.AsyncClient:
+        """Get the shared pooled HTTP client for the running loop.
+
+        Connections are kept alive across requests and A2AClient instances,
+        and multiplexed over HTTP/2 when h2 is installed. Each event loop gets
+        its own pool, closed by aclose_shared() or when the loop shuts down
+        (asyncio.run() finalizes async generators before closing its loop).
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        entry = cls._shared_clients.get(loop)
+        if entry is not None and not entry[0].is_closed:
+            return entry[0]
+
+        # Forget pools of loops that are already closed; they were closed at
+        # shutdown, or can no longer be awaited if the loop skipped it
+        for stale_loop in [key for key in cls._shared_clients if key is not None and key.is_closed()]:
+            del cls._shared_clients[stale_loop]
+
+        client = _new_http_client(httpx.Timeout(30.0, connect=5.0))
+        closer = None
+        if loop is not None:
+            closer = _close_at_loop_shutdown(client)
+            # Start it now so the loop tracks it (and finalizes it on shutdown)
+            try:
+                closer.asend(None).send(None)
+            except StopIteration:
+                pass
+        cls._shared_clients[loop] = (client, closer)
+        return client
+
+    @classmethod
+    async def aclose_shared(cls):
+        """Close the running loop's shared HTTP client (e.g. on application shutdown)."""
+        entry = cls._shared_clients.pop(asyncio.get_running_loop(), None)
+        if entry is None:
+            return
+        client, closer = entry
+        if closer is not None:
+            await closer.aclose()
+        else:
+            await client.aclose()
 
     @property
     def http_client(self) -> httpx.AsyncClient:
-        """Get HTTP client, creating if needed."""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=self.timeout)
-        return self._http_client
+        """Get HTTP client.
+
+        Returns the client owned by this instance when used as an async
+        context manager, otherwise the shared pooled client.
+        """
+        if self._http_client is not None:
+            return self._http_client
+        return self._get_shared_client()
 
     async def close(self):
-        """Close the client and release resources."""
+        """Close the client and release resources.
+
+        The shared pooled client is left open for other instances; use
+        aclose_shared() to close it.
+        """
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
 
+    aclose = close
+
+    def _next_id(self) -> str:
+        """Return a new JSON-RPC request id."""
+        return f"{self._id_prefix}-{next(self._id_counter):x}"
+
+    def _resolve_urls(self, agent_url: str) -> Tuple[str, str]:
+        """Return the JSON-RPC and streaming endpoints for an agent URL."""
+        urls = self._url_cache.get(agent_url)
+        if urls is None:
+            base = agent_url.rstrip("/")
+            rpc_url = base if base.endswith("/a2a") else f"{base}/a2a"
+            if base.endswith("/a2a/stream"):
+                stream_url = base
+            elif base.endswith("/a2a"):
+                stream_url = f"{base}/stream"
+            else:
+                stream_url = f"{base}/a2a/stream"
+            if len(self._url_cache) >= _URL_CACHE_SIZE:
+                self._url_cache.clear()
+            urls = self._url_cache[agent_url] = (rpc_url, stream_url)
+        return urls
+
     async def health_check(self, agent_url: str) -> bool:
         """Check if a remote agent is healthy and responsive.
         """
@@ -113,30 +375,79 @@ class A2AClient:
         base_url = base_url.rstrip("/")
 
         # Check cache
-        if not force_refresh and base_url in self._agent_cache:
-            return self._agent_cache[base_url]
+        if not force_refresh:
+            entry = self._agent_cache.get(base_url)
+            if entry is not None and time.monotonic() < entry[1]:
+                self._agent_cache.move_to_end(base_url)
+                return entry[0]
 
         try:
             response = await self.http_client.get(
                 f"{base_url}/.well-known/agent-card.json",
-                headers=self._headers
+                headers=self._headers,
+                timeout=self._request_timeout,
             )
             response.raise_for_status()
 
-            # Use Pydantic model_validate for Google A2A compatibility
-            card = AgentCard.model_validate(response.json())
-            self._agent_cache[base_url] = card
+            # Use Pydantic validation for Google A2A compatibility
+            card = await _parse_agent_card(response.content)
+            ttl = _max_age(response.headers.get("cache-control"), self.agent_cache_ttl)
+            if ttl > 0:
+                self._agent_cache[base_url] = (card, time.monotonic() + ttl)
+                self._agent_cache.move_to_end(base_url)
+                if len(self._agent_cache) > _AGENT_CACHE_SIZE:
+                    self._agent_cache.popitem(last=False)
+            else:
+                self._agent_cache.pop(base_url, None)
             return card
 
         except httpx.HTTPError as e:
             raise AgentDiscoveryError(
                 f"Failed to discover agent at {base_url}: {e}"
             )
-        except (json.JSONDecodeError, Exception) as e:
+        except (JSONDecodeError, Exception) as e:
             raise AgentDiscoveryError(
                 f"Invalid agent card at {base_url}: {e}"
             )
 
+    async def discover_agents(
+        self,
+        base_urls: List[str],
+        force_refresh: bool = False
+    ) -> Dict[str, AgentCard]:
+        """Discover several agents concurrently.
+
+        Returns a mapping of each given base URL to its Agent Card. URLs that
+        only differ by a trailing slash are fetched once. Agents that fail
+        discovery are logged and left out of the result.
+        """
+        # Same normalization as discover_agent, which also keys its cache on it
+        normalized = list(dict.fromkeys(url.rstrip("/") for url in base_urls))
+        results = await asyncio.gather(
+            *(self.discover_agent(url, force_refresh) for url in normalized),
+            return_exceptions=True,
+        )
+
+        found: Dict[str, AgentCard] = {}
+        for url, result in zip(normalized, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(f"Agent discovery failed for {url}: {result}")
+            else:
+                found[url] = result
+        return {
+            url: found[url.rstrip("/")] for url in base_urls if url.rstrip("/") in found
+        }
+
+    def invalidate_agent(self, base_url: str) -> None:
+        """Drop the cached Agent Card for an agent."""
+        self._agent_cache.pop(base_url.rstrip("/"), None)
+
+    def invalidate_all(self) -> None:
+        """Drop all cached Agent Cards."""
+        self._agent_cache.clear()
+
     async def send_task(
         self,
         agent_url: str,
@@ -146,10 +457,6 @@ class A2AClient:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Task:
         """Send a task to a remote agent."""
-        agent_url = agent_url.rstrip("/")
-        if not agent_url.endswith("/a2a"):
-            agent_url = f"{agent_url}/a2a"
-
         # Build request using Google A2A types
         params: Dict[str, Any] = {
             "message": message.model_dump(by_alias=True, exclude_none=True)
@@ -161,35 +468,10 @@ class A2AClient:
         if metadata:
             params["metadata"] = metadata
 
-        request = {
-            "jsonrpc": "2.0",
-            "method": "message/send",
-            "params": params,
-            "id": str(uuid.uuid4())
-        }
+        result = await self._rpc_call(agent_url, "message/send", params, "Task execution")
 
-        try:
-            response = await self.http_client.post(
-                agent_url,
-                json=request,
-                headers={**self._headers, "Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            if "error" in data and data["error"]:
-                raise TaskExecutionError(
-                    f"Task execution failed: {data['error'].get('message', 'Unknown error')}",
-                    error=data["error"]
-                )
-
-            # Use Pydantic model_validate for Google A2A compatibility
-            return Task.model_validate(data["result"])
-
-        except httpx.HTTPError as e:
-            raise TaskExecutionError(f"HTTP error: {e}")
-        except (json.JSONDecodeError, KeyError) as e:
-            raise TaskExecutionError(f"Invalid response: {e}")
+        # Use Pydantic model_validate for Google A2A compatibility
+        return Task.model_validate(result)
 
     async def stream_task(
         self,
@@ -197,14 +479,15 @@ class A2AClient:
         message: Message,
         task_id: Optional[str] = None,
         context_id: Optional[str] = None,
+        buffer_size: int = 1,
     ) -> AsyncIterator[StreamResponse]:
-        """Stream task responses from a remote agent."""
-        agent_url = agent_url.rstrip("/")
-        if not agent_url.endswith("/a2a/stream"):
-            if agent_url.endswith("/a2a"):
-                agent_url = f"{agent_url}/stream"
-            else:
-                agent_url = f"{agent_url}/a2a/stream"
+        """Stream task responses from a remote agent.
+
+        A background task reads and parses up to ``buffer_size`` events
+        ahead of the consumer, so network reads overlap with the caller's
+        processing of the previous event.
+        """
+        agent_url = self._resolve_urls(agent_url)[1]
 
         params: Dict[str, Any] = {
             "message": message.model_dump(by_alias=True, exclude_none=True)
@@ -218,33 +501,61 @@ class A2AClient:
             "jsonrpc": "2.0",
             "method": "message/stream",
             "params": params,
-            "id": str(uuid.uuid4())
+            "id": self._next_id()
         }
 
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, buffer_size))
+        done = object()
+
+        async def produce() -> None:
+            try:
+                async with self.http_client.stream(
+                    "POST",
+                    agent_url,
+                    content=dumps(request),
+                    headers=self._json_headers,
+                    timeout=self._request_timeout,
+                ) as response:
+                    response.raise_for_status()
+
+                    decoder = _SSEDecoder()
+                    async for chunk in response.aiter_bytes():
+                        for payload in decoder.feed(chunk):
+                            await queue.put(self._parse_stream_event(payload))
+                    for payload in decoder.flush():
+                        await queue.put(self._parse_stream_event(payload))
+            except httpx.HTTPError as e:
+                await queue.put(TaskExecutionError(f"Streaming error: {e}"))
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(done)
+
+        producer = asyncio.create_task(produce())
         try:
-            async with self.http_client.stream(
-                "POST",
-                agent_url,
-                json=request,
-                headers={**self._headers, "Content-Type": "application/json"}
-            ) as response:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = json.loads(line[6:])
-
-                        if "error" in data and data["error"]:
-                            raise TaskExecutionError(
-                                f"Stream error: {data['error'].get('message', 'Unknown error')}",
-                                error=data["error"]
-                            )
-
-                        result = data.get("result", {})
-                        yield self._parse_stream_response(result)
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Stops the read and closes the response if the consumer bailed early
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    def _parse_stream_event(self, payload: bytes) -> StreamResponse:
+        """Parse the JSON-RPC response carried by one SSE event."""
+        data = loads(payload)
+
+        if "error" in data and data["error"]:
+            raise TaskExecutionError(
+                f"Stream error: {data['error'].get('message', 'Unknown error')}",
+                error=data["error"]
+            )
 
-        except httpx.HTTPError as e:
-            raise TaskExecutionError(f"Streaming error: {e}")
+        return self._parse_stream_response(data.get("result", {}))
 
     def _parse_stream_response(self, data: Dict[str, Any]) -> StreamResponse:
         """Parse a stream response from raw data."""
@@ -269,35 +580,21 @@ class A2AClient:
         task_id: str
     ) -> Task:
         """Get a task by ID from a remote agent."""
-        agent_url = agent_url.rstrip("/")
-        if not agent_url.endswith("/a2a"):
-            agent_url = f"{agent_url}/a2a"
+        result = await self._rpc_call(agent_url, "tasks/get", {"id": task_id}, "Get task")
+        return Task.model_validate(result)
 
-        request = {
-            "jsonrpc": "2.0",
-            "method": "tasks/get",
-            "params": {"id": task_id},
-            "id": str(uuid.uuid4())
-        }
-
-        try:
-            response = await self.http_client.post(
-                agent_url,
-                json=request,
-                headers={**self._headers, "Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            if "error" in data and data["error"]:
-                raise TaskExecutionError(
-                    f"Get task failed: {data['error'].get('message', 'Unknown error')}"
-                )
-
-            return Task.model_validate(data["result"])
-
-        except httpx.HTTPError as e:
-            raise TaskExecutionError(f"HTTP error: {e}")
+    async def get_tasks(
+        self,
+        agent_url: str,
+        task_ids: List[str]
+    ) -> List[Task]:
+        """Get several tasks from a remote agent in one JSON-RPC batch request."""
+        if not task_ids:
+            return []
+        responses = await self._rpc_batch(
+            agent_url, [("tasks/get", {"id": task_id}) for task_id in task_ids]
+        )
+        return [Task.model_validate(self._rpc_result(data, "Get task")) for data in responses]
 
     async def list_tasks(
         self,
@@ -305,72 +602,92 @@ class A2AClient:
         context_id: Optional[str] = None
     ) -> List[Task]:
         """List tasks from a remote agent."""
-        agent_url = agent_url.rstrip("/")
-        if not agent_url.endswith("/a2a"):
-            agent_url = f"{agent_url}/a2a"
-
         params: Dict[str, Any] = {}
         if context_id:
             params["contextId"] = context_id
 
-        request = {
-            "jsonrpc": "2.0",
-            "method": "tasks/list",
-            "params": params,
-            "id": str(uuid.uuid4())
-        }
+        result = await self._rpc_call(agent_url, "tasks/list", params, "List tasks")
+        return [Task.model_validate(t) for t in result.get("tasks", [])]
+
+    async def cancel_task(
+        self,
+        agent_url: str,
+        task_id: str
+    ) -> Task:
+        """Cancel a task on a remote agent."""
+        result = await self._rpc_call(agent_url, "tasks/cancel", {"id": task_id}, "Cancel task")
+        return Task.model_validate(result)
 
+    async def _post_rpc(self, agent_url: str, payload: Any) -> Any:
+        """POST a JSON-RPC request (or batch) to an agent and decode the reply."""
         try:
             response = await self.http_client.post(
-                agent_url,
-                json=request,
-                headers={**self._headers, "Content-Type": "application/json"}
+                self._resolve_urls(agent_url)[0],
+                content=dumps(payload),
+                headers=self._json_headers,
+                timeout=self._request_timeout,
             )
             response.raise_for_status()
-
-            data = response.json()
-            if "error" in data and data["error"]:
-                raise TaskExecutionError(
-                    f"List tasks failed: {data['error'].get('message', 'Unknown error')}"
-                )
-
-            return [Task.model_validate(t) for t in data["result"].get("tasks", [])]
+            return await _decode_json(response)
 
         except httpx.HTTPError as e:
             raise TaskExecutionError(f"HTTP error: {e}")
+        except JSONDecodeError as e:
+            raise TaskExecutionError(f"Invalid response: {e}")
 
-    async def cancel_task(
+    @staticmethod
+    def _rpc_result(data: Dict[str, Any], action: str) -> Any:
+        """Return a JSON-RPC response's result, raising on an error response."""
+        error = data.get("error")
+        if error:
+            raise TaskExecutionError(
+                f"{action} failed: {error.get('message', 'Unknown error')}",
+                error=error
+            )
+        try:
+            return data["result"]
+        except KeyError as e:
+            raise TaskExecutionError(f"Invalid response: {e}")
+
+    async def _rpc_call(
         self,
         agent_url: str,
-        task_id: str
-    ) -> Task:
-        """Cancel a task on a remote agent."""
-        agent_url = agent_url.rstrip("/")
-        if not agent_url.endswith("/a2a"):
-            agent_url = f"{agent_url}/a2a"
-
+        method: str,
+        params: Dict[str, Any],
+        action: str,
+    ) -> Any:
+        """Make one JSON-RPC call; action names it in error messages."""
         request = {
             "jsonrpc": "2.0",
-            "method": "tasks/cancel",
-            "params": {"id": task_id},
-            "id": str(uuid.uuid4())
+            "method": method,
+            "params": params,
+            "id": self._next_id()
         }
+        data = await self._post_rpc(agent_url, request)
+        return self._rpc_result(data, action)
 
-        try:
-            response = await self.http_client.post(
-                agent_url,
-                json=request,
-                headers={**self._headers, "Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            if "error" in data and data["error"]:
-                raise TaskExecutionError(
-                    f"Cancel task failed: {data['error'].get('message', 'Unknown error')}"
-                )
-
-            return Task.model_validate(data["result"])
+    async def _rpc_batch(
+        self,
+        agent_url: str,
+        calls: List[Tuple[str, Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Send (method, params) calls as one JSON-RPC batch.
 
-        except httpx.HTTPError as e:
-            raise TaskExecutionError(f"HTTP error: {e}")
+        Returns the response objects in the order of calls (the server may
+        answer a batch in any order).
+        """
+        requests = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": self._next_id()}
+            for method, params in calls
+        ]
+        data = await self._post_rpc(agent_url, requests)
+        if not isinstance(data, list):
+            # A whole-batch failure comes back as a single error response
+            self._rpc_result(data, "Batch request")
+            raise TaskExecutionError("Invalid response: expected a batch response")
+
+        by_id = {response.get("id"): response for response in data}
+        try:
+            return [by_id[request["id"]] for request in requests]
+        except KeyError as e:
+            raise TaskExecutionError(f"Invalid response: missing batch entry {e}")
@@ -1,16 +1,18 @@
 """A2A Protocol Server."""
 
-from ag_ui.core import UserMessage
-from typing import Optional, Callable, AsyncIterator, Dict, Any
+from typing import Optional, Callable, AsyncIterator, Dict, Any, Tuple
 from contextlib import asynccontextmanager
 import json
 import asyncio
-import uuid
+import hashlib
+import os
+from collections import deque
 from datetime import datetime
 
 from ..core.exceptions import TaskExecutionError, InitializationError
 from ..utils.logger import get_logger
 from ..utils.config import get_default_aip_endpoint
+from ..utils.serialization import dumps, loads, JSONDecodeError
 
 logger = get_logger("a2a.server")
 
@@ -30,6 +32,66 @@ from a2a.client.helpers import create_text_message_object
 # Import Unibase extensions
 from .types import StreamResponse, A2AErrorCode
 
+# Task states after which a task can no longer change
+_TERMINAL_STATES = frozenset({TaskState.completed, TaskState.failed, TaskState.canceled})
+
+# Random bytes for new task/context ids are read in batches so that creating
+# a task doesn't cost a getrandom() syscall each time
+_UUID_BATCH = 4096
+_uuid_pool: deque = deque()
+
+# A forked worker (e.g. gunicorn/uvicorn --workers with preload) must not hand
+# out ids pre-generated in its parent, so it starts with an empty pool
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _refill_uuid_pool() -> None:
+    raw = bytearray(os.urandom(16 * _UUID_BATCH))
+    for i in range(0, len(raw), 16):
+        # RFC 4122 version 4 and variant bits, as uuid.uuid4() sets them
+        raw[i + 6] = (raw[i + 6] & 0x0F) | 0x40
+        raw[i + 8] = (raw[i + 8] & 0x3F) | 0x80
+        _uuid_pool.append(raw[i:i + 16].hex())
+
+
+def _new_hex_id() -> str:
+    """Return a random UUID4 as 32 hex digits (like uuid.uuid4().hex)."""
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        _refill_uuid_pool()
+        return _uuid_pool.popleft()
+
+
+def _new_id() -> str:
+    """Return a random UUID4 in canonical form (like str(uuid.uuid4()))."""
+    h = _new_hex_id()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _rpc_result(request_id: Any, result: Any) -> Dict[str, Any]:
+    """Build a JSON-RPC success response."""
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _rpc_error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """Build a JSON-RPC error response."""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+# Error responses that never vary, encoded once at import
+_PARSE_ERROR_BODY = dumps(_rpc_error(None, A2AErrorCode.PARSE_ERROR, "Invalid JSON"))
+_EMPTY_BATCH_BODY = dumps(_rpc_error(None, A2AErrorCode.INVALID_REQUEST, "Empty batch"))
+
+# Largest JSON-RPC batch accepted, and how many of its entries run at once,
+# so a single POST can't start an unbounded number of task handlers
+_MAX_BATCH_SIZE = 100
+_BATCH_CONCURRENCY = 10
+_BATCH_TOO_LARGE_BODY = dumps(_rpc_error(
+    None, A2AErrorCode.INVALID_REQUEST, f"Batch too large (max {_MAX_BATCH_SIZE} requests)"
+))
+
 
 class A2AServer:
     """A2A-compliant server for exposing Unibase agents."""
@@ -44,6 +106,10 @@ class A2AServer:
         auto_register: bool = True,
     ):
         """Initialize A2A server."""
+        # Encoded agent card response and its ETag, rebuilt after invalidate_card()
+        self._agent_card_body: Optional[bytes] = None
+        self._agent_card_etag: Optional[str] = None
+
         self.agent_card = agent_card
         self.task_handler = task_handler
         self.host = host
@@ -58,13 +124,83 @@ class A2AServer:
         self._agent_id: Optional[str] = None
         self._aip_client = None
 
+        # Shared HTTP client for AIP event queries (created on first use)
+        self._http_client = None
+
         # Gateway polling state
         self._polling_task: Optional[asyncio.Task] = None
         self._should_poll = False
 
+        # JSON-RPC dispatch table (bound once instead of per request)
+        self._method_handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "message/send": self._handle_message_send,
+            "tasks/get": self._handle_tasks_get,
+            "tasks/list": self._handle_tasks_list,
+            "tasks/cancel": self._handle_tasks_cancel,
+        }
+
         # Create FastAPI app
         self._app = None
 
+    @property
+    def agent_card(self) -> AgentCard:
+        """The served Agent Card."""
+        return self._agent_card
+
+    @agent_card.setter
+    def agent_card(self, card: AgentCard):
+        self._agent_card = card
+        self.invalidate_card()
+
+    @property
+    def registration_config(self) -> Optional[Dict[str, Any]]:
+        """Registration settings; endpoint_url here overrides the card's url."""
+        return self._registration_config
+
+    @registration_config.setter
+    def registration_config(self, config: Optional[Dict[str, Any]]):
+        # Copied so later changes to the caller's dict don't bypass invalidation
+        self._registration_config = dict(config) if config is not None else None
+        self.invalidate_card()
+
+    @property
+    def host(self) -> str:
+        """Bind host (also used in the card's fallback url)."""
+        return self._host
+
+    @host.setter
+    def host(self, host: str):
+        self._host = host
+        self.invalidate_card()
+
+    @property
+    def port(self) -> int:
+        """Bind port (also used in the card's fallback url)."""
+        return self._port
+
+    @port.setter
+    def port(self, port: int):
+        self._port = port
+        self.invalidate_card()
+
+    def invalidate_card(self) -> None:
+        """Drop the encoded agent card so the next request re-serializes it.
+
+        Assigning agent_card, registration_config, host or port does this
+        automatically; call it after changing the card or registration_config
+        in place.
+        """
+        self._agent_card_body = None
+        self._agent_card_etag = None
+
+    def _agent_card_response(self) -> Tuple[bytes, str]:
+        """Return the encoded agent card and its ETag, serializing it only once."""
+        if self._agent_card_body is None:
+            body = dumps(self._serialize_agent_card())
+            self._agent_card_etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            self._agent_card_body = body
+        return self._agent_card_body, self._agent_card_etag
+
     def _serialize_agent_card(self) -> Dict[str, Any]:
         """Serialize agent card to dict using Pydantic."""
         card_data = self.agent_card.model_dump(by_alias=True, exclude_none=True)
@@ -103,6 +239,15 @@ class A2AServer:
                 "Install it with: pip install fastapi uvicorn"
             )
 
+        # ag_ui is only needed by the AG-UI endpoint, keep it off the import path
+        try:
+            from ag_ui.core import UserMessage
+        except ImportError:
+            raise InitializationError(
+                "ag-ui-protocol is required for the AG-UI endpoint. "
+                "Install it with: pip install ag-ui-protocol"
+            )
+
         @asynccontextmanager
         async def lifespan(app):
             logger.info(f"A2A Server starting at http://{self.host}:{self.port}")
@@ -136,6 +281,12 @@ class A2AServer:
                     pass
             if self._aip_client:
                 await self._aip_client.close()
+            if self._http_client:
+                await self._http_client.aclose()
+                self._http_client = None
+            # Release the A2AClient pool shared by handlers on this loop
+            from .client import A2AClient
+            await A2AClient.aclose_shared()
             logger.info("A2A Server shutting down")
 
         app = FastAPI(
@@ -156,8 +307,18 @@ class A2AServer:
 
         # Agent Card endpoint
         @app.get("/.well-known/agent-card.json")
-        async def get_agent_card():
-            return JSONResponse(content=self._serialize_agent_card())
+        async def get_agent_card(request: Request):
+            body, etag = self._agent_card_response()
+            headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+
+            # Let clients revalidate a cached card without re-downloading it
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match:
+                tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+                if "*" in tags or etag in tags:
+                    return Response(status_code=304, headers=headers)
+
+            return Response(content=body, media_type="application/json", headers=headers)
 
         # JSON-RPC endpoint - available at both / and /a2a for compatibility
         # Google A2A protocol expects JSONRPC at root URL
@@ -165,49 +326,59 @@ class A2AServer:
         @app.post("/a2a")
         async def jsonrpc_endpoint(request: Request):
             try:
-                body = await request.json()
+                body = loads(await request.body())
+
+                # JSON-RPC 2.0 batch: handle entries concurrently (bounded)
+                if isinstance(body, list):
+                    if not body:
+                        return Response(content=_EMPTY_BATCH_BODY, status_code=400, media_type="application/json")
+                    if len(body) > _MAX_BATCH_SIZE:
+                        return Response(content=_BATCH_TOO_LARGE_BODY, status_code=400, media_type="application/json")
+
+                    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+                    async def handle_entry(entry: Any) -> Optional[Dict[str, Any]]:
+                        async with semaphore:
+                            return await self._handle_batch_entry(entry)
+
+                    results = await asyncio.gather(*(handle_entry(entry) for entry in body))
+                    results = [result for result in results if result is not None]
+                    if not results:
+                        # Batch of notifications only: nothing to answer
+                        return Response(status_code=204)
+                    return Response(content=dumps(results), media_type="application/json")
+
                 rpc_request = self._parse_jsonrpc_request(body)
 
                 # Route to appropriate handler
                 result = await self._handle_jsonrpc(rpc_request, body.get("id"))
 
-                return JSONResponse(content=result)
+                return Response(content=dumps(result), media_type="application/json")
 
-            except json.JSONDecodeError:
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {"code": A2AErrorCode.PARSE_ERROR, "message": "Invalid JSON"}
-                }
-                return JSONResponse(content=error_response, status_code=400)
+            except JSONDecodeError:
+                return Response(content=_PARSE_ERROR_BODY, status_code=400, media_type="application/json")
             except Exception as e:
                 logger.exception(f"Error handling JSON-RPC request: {e}")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {"code": A2AErrorCode.INTERNAL_ERROR, "message": str(e)}
-                }
+                error_response = _rpc_error(None, A2AErrorCode.INTERNAL_ERROR, str(e))
                 return JSONResponse(content=error_response, status_code=500)
 
         # Streaming endpoint using SSE
         @app.post("/a2a/stream")
         async def stream_endpoint(request: Request):
             try:
-                body = await request.json()
+                body = loads(await request.body())
                 rpc_request = self._parse_jsonrpc_request(body)
 
                 if rpc_request["method"] != "message/stream":
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": body.get("id"),
-                        "error": {"code": A2AErrorCode.METHOD_NOT_FOUND, "message": "Streaming only supports message/stream"}
-                    }
+                    error_response = _rpc_error(body.get("id"), A2AErrorCode.METHOD_NOT_FOUND, "Streaming only supports message/stream")
                     return JSONResponse(content=error_response, status_code=400)
 
                 async def event_generator():
+                    # Frames are built as bytes so Starlette sends them without
+                    # re-encoding; each frame is a fresh object because the ASGI
+                    # server may still hold the previous one.
                     async for response in self._handle_message_stream(rpc_request, body.get("id")):
-                        data = json.dumps(response)
-                        yield f"data: {data}\n\n"
+                        yield b"data: " + dumps(response) + b"\n\n"
 
                 return StreamingResponse(
                     event_generator(),
@@ -216,18 +387,14 @@ class A2AServer:
 
             except Exception as e:
                 logger.exception(f"Error in stream endpoint: {e}")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {"code": A2AErrorCode.INTERNAL_ERROR, "message": str(e)}
-                }
+                error_response = _rpc_error(None, A2AErrorCode.INTERNAL_ERROR, str(e))
                 return JSONResponse(content=error_response, status_code=500)
 
         # AG-UI Streaming endpoint (Raw SSE support)
         @app.post("/agui/stream")
         async def stream_agui_endpoint(request: Request):
             try:
-                body = await request.json()
+                body = loads(await request.body())
                 user_msg = UserMessage.model_validate(body)
                 # Manually convert ag_ui UserMessage to SDK Message
                 # ag_ui UserMessage: id, role, content (list or str), name, etc.
@@ -250,7 +417,7 @@ class A2AServer:
                 conversation_id = body.get("id")
 
                 msg_data = {
-                    "messageId": uuid.uuid4().hex,
+                    "messageId": _new_hex_id(),
                     "role": user_msg.role,
                     "parts": parts,
                     "metadata": {} # Add metadata if available
@@ -260,7 +427,7 @@ class A2AServer:
                 
                 async def event_generator():
                     # Determine task (conversation) context
-                    task_id = conversation_id or uuid.uuid4().hex
+                    task_id = conversation_id or _new_hex_id()
                     
                     if task_id in self._tasks:
                         # Continue existing conversation
@@ -278,7 +445,7 @@ class A2AServer:
                         # New conversation
                         task = Task(
                             id=task_id,
-                            context_id=uuid.uuid4().hex,
+                            context_id=_new_hex_id(),
                             status=TaskStatus(state=TaskState.working),
                             history=[msg],
                         )
@@ -361,7 +528,7 @@ class A2AServer:
                              if event:
                                  # For simplicity, just json dump if it happens to be not raw
                                  # But for ag_ui stream, we expect raw content mostly
-                                 yield f"data: {json.dumps(event.model_dump(by_alias=True))}\n\n"
+                                 yield b"data: " + dumps(event.model_dump(by_alias=True, mode="json")) + b"\n\n"
                     
                     # If we accumulated content but no message was added to history, synthesize one
                     if accumulated_content and len(history) == initial_history_len:
@@ -373,7 +540,7 @@ class A2AServer:
                     
                     # Finalize task state
                     final_state = task.status.state
-                    if final_state not in [TaskState.completed, TaskState.failed, TaskState.canceled]:
+                    if final_state not in _TERMINAL_STATES:
                         final_state = TaskState.completed
                     
                     task = Task(
@@ -465,43 +632,35 @@ class A2AServer:
             "id": body.get("id"),
         }
 
+    async def _handle_batch_entry(self, entry: Any) -> Optional[Dict[str, Any]]:
+        """Handle one request of a JSON-RPC batch, reporting invalid entries inline.
+
+        Returns None for notifications (valid entries without an id), which
+        must not be answered.
+        """
+        if not isinstance(entry, dict):
+            return _rpc_error(None, A2AErrorCode.INVALID_REQUEST, "Invalid request")
+        try:
+            rpc_request = self._parse_jsonrpc_request(entry)
+        except ValueError as e:
+            return _rpc_error(entry.get("id"), A2AErrorCode.INVALID_REQUEST, str(e))
+        response = await self._handle_jsonrpc(rpc_request, rpc_request["id"])
+        return response if "id" in entry else None
+
     async def _handle_jsonrpc(self, request: Dict[str, Any], request_id: Any) -> Dict[str, Any]:
         """Handle JSON-RPC request and return response."""
-        method_handlers = {
-            "message/send": self._handle_message_send,
-            "tasks/get": self._handle_tasks_get,
-            "tasks/list": self._handle_tasks_list,
-            "tasks/cancel": self._handle_tasks_cancel,
-        }
-
-        handler = method_handlers.get(request["method"])
+        handler = self._method_handlers.get(request["method"])
         if not handler:
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": A2AErrorCode.METHOD_NOT_FOUND, "message": f"Method not found: {request['method']}"}
-            }
+            return _rpc_error(request_id, A2AErrorCode.METHOD_NOT_FOUND, f"Method not found: {request['method']}")
 
         try:
             result = await handler(request["params"])
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": result
-            }
+            return _rpc_result(request_id, result)
         except TaskExecutionError as e:
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": A2AErrorCode.TASK_NOT_FOUND, "message": str(e)}
-            }
+            return _rpc_error(request_id, A2AErrorCode.TASK_NOT_FOUND, str(e))
         except Exception as e:
             logger.exception(f"Error handling {request['method']}: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": A2AErrorCode.INTERNAL_ERROR, "message": str(e)}
-            }
+            return _rpc_error(request_id, A2AErrorCode.INTERNAL_ERROR, str(e))
 
     async def _handle_message_send(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle message/send method."""
@@ -510,8 +669,8 @@ class A2AServer:
         message = self._parse_message(message_data)
 
         # Get or create task
-        task_id = params.get("id") or str(uuid.uuid4())
-        context_id = params.get("contextId") or str(uuid.uuid4())
+        task_id = params.get("id") or _new_id()
+        context_id = params.get("contextId") or _new_id()
 
         if task_id in self._tasks:
             task = self._tasks[task_id]
@@ -571,7 +730,7 @@ class A2AServer:
 
             # Mark as completed if not already in terminal state
             final_state = task.status.state
-            if final_state not in [TaskState.completed, TaskState.failed, TaskState.canceled]:
+            if final_state not in _TERMINAL_STATES:
                 final_state = TaskState.completed
 
             task = Task(
@@ -625,8 +784,8 @@ class A2AServer:
         message = self._parse_message(message_data)
 
         # Get or create task
-        task_id = params.get("id") or str(uuid.uuid4())
-        context_id = params.get("contextId") or str(uuid.uuid4())
+        task_id = params.get("id") or _new_id()
+        context_id = params.get("contextId") or _new_id()
 
         if task_id in self._tasks:
             task = self._tasks[task_id]
@@ -671,11 +830,7 @@ class A2AServer:
             async for response in self.task_handler(task, message):
                 event = response.get_event()
                 if event:
-                    yield {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": event.model_dump(by_alias=True, exclude_none=True)
-                    }
+                    yield _rpc_result(request_id, event.model_dump(by_alias=True, exclude_none=True))
 
                 # Update task state
                 if response.message:
@@ -694,7 +849,7 @@ class A2AServer:
 
             # Final response with completed task
             final_state = task.status.state
-            if final_state not in [TaskState.completed, TaskState.failed, TaskState.canceled]:
+            if final_state not in _TERMINAL_STATES:
                 final_state = TaskState.completed
 
             task = Task(
@@ -707,11 +862,7 @@ class A2AServer:
             )
             self._tasks[task_id] = task
 
-            yield {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": self._serialize_task(task)
-            }
+            yield _rpc_result(request_id, self._serialize_task(task))
 
         except Exception as e:
             logger.exception(f"Error in stream handler: {e}")
@@ -726,11 +877,7 @@ class A2AServer:
             )
             self._tasks[task_id] = task
 
-            yield {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "result": self._serialize_task(task)
-            }
+            yield _rpc_result(request_id, self._serialize_task(task))
 
     async def _handle_tasks_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tasks/get method."""
@@ -761,7 +908,7 @@ class A2AServer:
         task = self._tasks[task_id]
 
         # Can only cancel non-terminal tasks
-        if task.status.state in [TaskState.completed, TaskState.failed, TaskState.canceled]:
+        if task.status.state in _TERMINAL_STATES:
             raise TaskExecutionError(f"Task {task_id} is already in terminal state")
 
         task = Task(
@@ -936,6 +1083,21 @@ class A2AServer:
             except Exception as submit_error:
                 logger.error(f"Failed to submit error result: {submit_error}")
 
+    def _get_http_client(self):
+        """Return the shared httpx client, creating it on first use.
+
+        Reusing one client keeps connections to the AIP platform alive
+        across requests instead of paying a new handshake each time.
+        """
+        if self._http_client is None:
+            import httpx
+
+            self._http_client = httpx.AsyncClient(
+                timeout=5.0,
+                limits=httpx.Limits(keepalive_expiry=60.0),
+            )
+        return self._http_client
+
     async def _get_aip_events(self) -> Optional[list]:
         """Get recent AIP events (payments, memory) for this agent.
 
@@ -947,46 +1109,45 @@ class A2AServer:
             return None
 
         try:
-            import httpx
             from datetime import datetime
 
             aip_endpoint = self.registration_config.get("aip_endpoint", get_default_aip_endpoint())
             agent_id = self._agent_id or f"erc8004:{self.registration_config.get('handle', '')}"
 
             # Query AIP for recent events for this agent
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{aip_endpoint}/agents/{agent_id}/events",
-                    params={"limit": 10, "types": "payment_settled,memory_uploaded"}
-                )
+            client = self._get_http_client()
+            response = await client.get(
+                f"{aip_endpoint}/agents/{agent_id}/events",
+                params={"limit": 10, "types": "payment_settled,memory_uploaded"}
+            )
 
-                if response.status_code == 200:
-                    events = response.json()
-                    if events:
-                        # Transform events to AG-UI compatible format
-                        result = []
-                        for event in events:
-                            event_type = event.get("type", "")
-                            if event_type in ("payment_settled", "payment.settled"):
-                                result.append({
-                                    "type": "payment",
-                                    "agent_id": event.get("destination") or agent_id,
-                                    "amount": float(event.get("amount", 0)),
-                                    "currency": event.get("currency", "USD"),
-                                    "timestamp": event.get("ts", datetime.now().isoformat()),
-                                    "transaction_url": event.get("tx_url"),
-                                    "status": "settled"
-                                })
-                            elif "memory" in event_type:
-                                result.append({
-                                    "type": "memory",
-                                    "scope": event.get("scope") or event.get("key", "unknown"),
-                                    "operation": event.get("operation", "write"),
-                                    "timestamp": event.get("ts", datetime.now().isoformat()),
-                                    "membase_url": event.get("membase_url"),
-                                    "data_size": event.get("size")
-                                })
-                        return result if result else None
+            if response.status_code == 200:
+                events = response.json()
+                if events:
+                    # Transform events to AG-UI compatible format
+                    result = []
+                    for event in events:
+                        event_type = event.get("type", "")
+                        if event_type in ("payment_settled", "payment.settled"):
+                            result.append({
+                                "type": "payment",
+                                "agent_id": event.get("destination") or agent_id,
+                                "amount": float(event.get("amount", 0)),
+                                "currency": event.get("currency", "USD"),
+                                "timestamp": event.get("ts", datetime.now().isoformat()),
+                                "transaction_url": event.get("tx_url"),
+                                "status": "settled"
+                            })
+                        elif "memory" in event_type:
+                            result.append({
+                                "type": "memory",
+                                "scope": event.get("scope") or event.get("key", "unknown"),
+                                "operation": event.get("operation", "write"),
+                                "timestamp": event.get("ts", datetime.now().isoformat()),
+                                "membase_url": event.get("membase_url"),
+                                "data_size": event.get("size")
+                            })
+                    return result if result else None
         except Exception as e:
             logger.debug(f"Failed to get AIP events: {e}")
 
@@ -1018,8 +1179,19 @@ class A2AServer:
         await server.serve()
 
     def run_sync(self):
-        """Start the A2A server synchronously."""
-        asyncio.run(self.run())
+        """Start the A2A server synchronously (on uvloop when installed)."""
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(self.run())
+            return
+
+        if hasattr(uvloop, "run"):
+            uvloop.run(self.run())
+        else:
+            # uvloop < 0.18 has no run(); install() isn't deprecated there
+            uvloop.install()
+            asyncio.run(self.run())
 
 
 def create_simple_handler(
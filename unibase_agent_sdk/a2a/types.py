@@ -22,6 +22,9 @@ from aip_sdk.types import (
 class StreamResponse:
     """Wrapper for streaming responses from agent to client."""
 
+    # One of these is allocated per streamed chunk; slots keep them small
+    __slots__ = ("task", "message", "status_update", "artifact_update", "raw_content")
+
     def __init__(
         self,
         task: Optional[Task] = None,
@@ -18,6 +18,9 @@ from aip_sdk.gateway import GatewayClient
 
 logger = get_logger("registry.registry")
 
+# How long a remote agent listing from AIP is reused before querying again
+REMOTE_AGENTS_TTL = 5.0
+
 
 class RegistrationMode(Enum):
     """Agent registration mode."""
@@ -82,6 +85,9 @@ class AgentRegistryClient:
         self._agents: Dict[str, Any] = {}
         self._identities: Dict[str, AgentIdentity] = {}
 
+        # Short-lived cache of the AIP agent listing: (fetched_at, agents)
+        self._remote_agents_cache: Optional[tuple] = None
+
         # AIP SDK Client (required for all platform communication)
         self._aip_client = AsyncAIPClient(base_url=self.aip_endpoint)
 
@@ -90,8 +96,9 @@ class AgentRegistryClient:
         if self.mode == RegistrationMode.GATEWAY:
             self._gateway_client = GatewayClient(self.gateway_url)
 
-        # HTTP client for Membase communication (agent-sdk specific feature)
-        self._http_client = httpx.AsyncClient(timeout=10.0)
+        # HTTP client for Membase communication (agent-sdk specific feature),
+        # created on first use so constructing a registry does no network setup
+        self._http_client: Optional[httpx.AsyncClient] = None
 
         # A2A Protocol support (agent-sdk specific feature)
         self._a2a_client = A2AClient()
@@ -109,6 +116,12 @@ class AgentRegistryClient:
             if not asyncio.run(self.wait_for_services(max_attempts=max_attempts)):
                 logger.warning("Some services are not healthy, but continuing initialization")
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the Membase HTTP client, creating it on first use."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=10.0)
+        return self._http_client
+
     async def health_check(self) -> Dict[str, bool]:
         """Check health of all remote services.
 
@@ -120,36 +133,43 @@ class AgentRegistryClient:
             if not all(health.values()):
                 print(f"Unhealthy services: {[k for k, v in health.items() if not v]}")
         """
-        results = {}
+        import asyncio
 
-        # Check AIP platform
-        try:
-            results["aip_platform"] = await self._aip_client.health_check()
-        except Exception as e:
-            logger.warning(f"AIP platform health check failed: {e}")
-            results["aip_platform"] = False
+        async def check_aip() -> bool:
+            try:
+                return await self._aip_client.health_check()
+            except Exception as e:
+                logger.warning(f"AIP platform health check failed: {e}")
+                return False
 
-        # Check Gateway (if in gateway mode)
-        if self.mode == RegistrationMode.GATEWAY and self._gateway_client:
+        async def check_gateway() -> bool:
             try:
-                results["gateway"] = await self._gateway_client.health_check()
+                return await self._gateway_client.health_check()
             except Exception as e:
                 logger.warning(f"Gateway health check failed: {e}")
-                results["gateway"] = False
+                return False
 
-        # Check Membase (if not in gateway mode)
-        if self.mode != RegistrationMode.GATEWAY:
+        async def check_membase() -> bool:
             try:
-                response = await self._http_client.get(
+                response = await self._get_http_client().get(
                     f"{self.membase_endpoint}/health",
                     timeout=5.0
                 )
-                results["membase"] = response.status_code == 200
+                return response.status_code == 200
             except Exception as e:
                 logger.warning(f"Membase health check failed: {e}")
-                results["membase"] = False
+                return False
 
-        return results
+        # Check AIP platform, plus Gateway (gateway mode) or Membase (otherwise)
+        checks = {"aip_platform": check_aip()}
+        if self.mode == RegistrationMode.GATEWAY and self._gateway_client:
+            checks["gateway"] = check_gateway()
+        if self.mode != RegistrationMode.GATEWAY:
+            checks["membase"] = check_membase()
+
+        # Services are independent, so check them concurrently
+        statuses = await asyncio.gather(*checks.values())
+        return dict(zip(checks.keys(), statuses))
 
     async def wait_for_services(
         self,
@@ -280,6 +300,8 @@ class AgentRegistryClient:
             result = await self._aip_client.register_agent(user_id, agent_config)
             agent_id = result.get("agent_id", self._generate_agent_id(name))
             logger.info(f"Agent registered with AIP platform: {agent_id}")
+            # The platform listing changed, don't serve a stale one
+            self._remote_agents_cache = None
         except Exception as e:
             logger.warning(f"AIP registration failed, using local ID: {e}")
             agent_id = self._generate_agent_id(name)
@@ -312,7 +334,37 @@ class AgentRegistryClient:
             logger.info(f"  Accessible at: {endpoint_url}")
 
         return identity
-    
+
+    async def register_agents(
+        self,
+        agents: List[Dict[str, Any]],
+        max_concurrency: int = 10,
+    ) -> List[AgentIdentity]:
+        """Register several agents concurrently.
+
+        Args:
+            agents: One dict of register_agent keyword arguments per agent
+            max_concurrency: Maximum registrations in flight at once
+
+        Returns:
+            AgentIdentity list in the same order as agents
+
+        Example:
+            identities = await registry.register_agents([
+                {"name": "Planner", "agent_type": AgentType.CUSTOM},
+                {"name": "Writer", "agent_type": AgentType.CUSTOM},
+            ])
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def register_one(kwargs: Dict[str, Any]) -> AgentIdentity:
+            async with semaphore:
+                return await self.register_agent(**kwargs)
+
+        return list(await asyncio.gather(*(register_one(kwargs) for kwargs in agents)))
+
     def register_agent_instance(
         self,
         agent: Any,
@@ -406,7 +458,7 @@ class AgentRegistryClient:
     async def _initialize_membase(self, identity: AgentIdentity) -> None:
         """Initialize memory space in Membase."""
         try:
-            response = await self._http_client.post(
+            response = await self._get_http_client().post(
                 f"{self.membase_endpoint}/agents/init",
                 json={
                     "agent_id": identity.agent_id,
@@ -459,13 +511,20 @@ class AgentRegistryClient:
             return None
     
     async def _query_all_agents_from_aip(self) -> List[AgentIdentity]:
-        """Query all registered agents from AIP platform using AIP SDK."""
+        """Query all registered agents from AIP platform using AIP SDK.
+
+        Successful listings are reused for REMOTE_AGENTS_TTL seconds.
+        """
+        cached = self._remote_agents_cache
+        if cached and time.monotonic() - cached[0] < REMOTE_AGENTS_TTL:
+            return list(cached[1])
+
         try:
             # Use AIP SDK to list all agents
             agents_info = await self._aip_client.list_agents()
 
             # Convert to AgentIdentity list
-            return [
+            agents = [
                 AgentIdentity(
                     agent_id=agent.agent_id,
                     name=agent.name,
@@ -485,6 +544,9 @@ class AgentRegistryClient:
         except Exception as e:
             logger.warning(f"Failed to list agents from AIP: {e}", exc_info=True)
             return []
+
+        self._remote_agents_cache = (time.monotonic(), agents)
+        return list(agents)
     
     async def register_agent_group(
         self,
@@ -553,10 +615,20 @@ class AgentRegistryClient:
 
     async def close(self):
         """Close the registry and clean up resources."""
+        import asyncio
+
+        closers = [self._a2a_client.close(), A2AClient.aclose_shared()]
+        if self._http_client is not None:
+            closers.append(self._http_client.aclose())
+            self._http_client = None
         if self._aip_client:
-            await self._aip_client.close()
-        await self._http_client.aclose()
-        await self._a2a_client.close()
+            closers.append(self._aip_client.close())
+
+        # Close clients concurrently; one failing doesn't leave the others open
+        results = await asyncio.gather(*closers, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Error closing registry client: {result}")
     
     # ============================================================
     # A2A Protocol Methods
@@ -0,0 +1,49 @@
+"""JSON serialization helpers (orjson when available, stdlib json otherwise)."""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional: pip install unibase-agent-sdk[speedups]
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON, matching Starlette's JSONResponse rendering."""
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS)
+        except TypeError:
+            # Types orjson doesn't handle (e.g. ints over 64 bits)
+            return _json_dumps(obj)
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+    JSONDecodeError = orjson.JSONDecodeError
+else:
+    dumps = _json_dumps
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    JSONDecodeError = json.JSONDecodeError
+
+
+__all__ = ["dumps", "loads", "JSONDecodeError"]
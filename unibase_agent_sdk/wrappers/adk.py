@@ -14,6 +14,7 @@ from a2a.client.helpers import create_text_message_object
 
 from ..a2a.server import A2AServer
 from ..a2a.types import StreamResponse, AgentMessage
+from ..a2a.agent_card import DEFAULT_IO_MODES
 from ..utils.logger import get_logger
 from ..utils.config import get_default_aip_endpoint
 
@@ -229,8 +230,8 @@ class ADKWrapper:
             version=self.version,
             skills=self.skills,
             capabilities=AgentCapabilities(streaming=True),
-            default_input_modes=["text/plain", "application/json"],
-            default_output_modes=["text/plain", "application/json"],
+            default_input_modes=list(DEFAULT_IO_MODES),
+            default_output_modes=list(DEFAULT_IO_MODES),
         )
 
         # Build registration config
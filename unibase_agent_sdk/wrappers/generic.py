@@ -30,11 +30,12 @@ from a2a.client.helpers import create_text_message_object
 # Import Unibase extensions
 from unibase_agent_sdk.a2a.server import A2AServer
 from unibase_agent_sdk.a2a.types import StreamResponse, AgentMessage
+from unibase_agent_sdk.a2a.agent_card import DEFAULT_IO_MODES
 from unibase_agent_sdk.utils.logger import get_logger
 from unibase_agent_sdk.utils.config import get_default_aip_endpoint
 
 # Import CostModel from SDK
-from aip_sdk.types import CostModel
+from aip_sdk.types import CostModel, MessageContext
 
 logger = get_logger("wrappers.generic")
 
@@ -102,8 +103,6 @@ def parse_agent_message(message: Message) -> AgentMessage:
 
     # Default: Treat text as intent
     # Use message_id as run_id if available, to ensure we have some context
-    from aip_sdk.types import MessageContext
-    
     return AgentMessage(
         intent=text,
         context=MessageContext(
@@ -293,8 +292,8 @@ def expose_as_a2a(
         version=version,
         skills=skills,
         capabilities=AgentCapabilities(streaming=streaming),
-        default_input_modes=["text/plain", "application/json"],
-        default_output_modes=["text/plain", "application/json"],
+        default_input_modes=list(DEFAULT_IO_MODES),
+        default_output_modes=list(DEFAULT_IO_MODES),
         **kwargs,
     )
 
@@ -374,6 +373,7 @@ class AgentWrapper:
             self.skill_methods = self._auto_detect_methods()
 
         self._validate_methods()
+        self._build_dispatch()
 
     def _auto_detect_methods(self) -> dict[str, str]:
         """Auto-detect public methods that could be skills."""
@@ -400,6 +400,15 @@ class AgentWrapper:
                     f"Agent has no method '{method_name}' for skill '{skill_id}'"
                 )
 
+    def _build_dispatch(self):
+        """Resolve each skill to its bound method once, instead of per request."""
+        self._dispatch = {}
+        for skill_id, method_name in self.skill_methods.items():
+            method = getattr(self.agent, method_name)
+            self._dispatch[skill_id] = (method, asyncio.iscoroutinefunction(method))
+        # The first skill handles requests that don't name a known one
+        self._default_dispatch = next(iter(self._dispatch.values()), None)
+
     def _build_skills(self) -> List[AgentSkill]:
         """Build AgentSkill list from skill_methods."""
         skills = []
@@ -433,24 +442,18 @@ class AgentWrapper:
             }
         )
 
-        # For single-skill agents, use the only method
-        if len(self.skill_methods) == 1:
-            method_name = list(self.skill_methods.values())[0]
-        else:
-            # Check if hints suggest a specific skill
-            if agent_message.hints and agent_message.hints.suggested_task:
-                suggested = agent_message.hints.suggested_task
-                if suggested in self.skill_methods:
-                    method_name = self.skill_methods[suggested]
-                else:
-                    method_name = list(self.skill_methods.values())[0]
-            else:
-                method_name = list(self.skill_methods.values())[0]
+        if self._default_dispatch is None:
+            raise ValueError(f"Agent '{self.name}' has no skill methods")
 
-        method = getattr(self.agent, method_name)
+        # Use the skill suggested by hints if there is one, else the first skill
+        method, is_async = self._default_dispatch
+        if len(self._dispatch) > 1 and agent_message.hints and agent_message.hints.suggested_task:
+            method, is_async = self._dispatch.get(
+                agent_message.hints.suggested_task, self._default_dispatch
+            )
 
         # Call the method
-        if asyncio.iscoroutinefunction(method):
+        if is_async:
             result = await method(input_text)
         else:
             loop = asyncio.get_event_loop()
@@ -471,8 +474,8 @@ class AgentWrapper:
             version=self.version,
             skills=self._build_skills(),
             capabilities=AgentCapabilities(),
-            default_input_modes=["text/plain", "application/json"],
-            default_output_modes=["text/plain", "application/json"],
+            default_input_modes=list(DEFAULT_IO_MODES),
+            default_output_modes=list(DEFAULT_IO_MODES),
             metadata=self.metadata,
         )
 
@@ -13,6 +13,7 @@ from a2a.client.helpers import create_text_message_object
 
 from ..a2a.server import A2AServer
 from ..a2a.types import StreamResponse, AgentMessage
+from ..a2a.agent_card import DEFAULT_IO_MODES
 from ..utils.logger import get_logger
 from ..utils.config import get_default_aip_endpoint
 
@@ -164,8 +165,8 @@ class LangGraphWrapper:
             version=self.version,
             skills=self.skills,
             capabilities=AgentCapabilities(streaming=True),
-            default_input_modes=["text/plain", "application/json"],
-            default_output_modes=["text/plain", "application/json"],
+            default_input_modes=list(DEFAULT_IO_MODES),
+            default_output_modes=list(DEFAULT_IO_MODES),
         )
 
         # Build registration config